@@ -0,0 +1,192 @@
+"""
+    benchmarks/run.py
+    ~~~~~~~~~~~~~~~~~
+    Offline benchmarks for the hot paths of datestuff. Results are compared against a
+    stored baseline and any benchmark slower than the threshold is reported.
+
+        python benchmarks/run.py                      # compare against baseline.json
+        python benchmarks/run.py --save baseline.json  # store a new baseline
+        python benchmarks/run.py --filter contains     # only matching benchmarks
+
+    Timings are per call in seconds, the best of several repeats. Baselines are
+    machine specific, regenerate them when changing hardware or Python versions.
+    :copyright: 2016, Alec Reiter
+    :license: MIT, see LICENSE for more details
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+from datetime import date, datetime, timedelta
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, os.pardir, "src"))
+
+from datestuff import DateRange, RelativeDate, within_delta  # noqa: E402
+
+BASELINE = os.path.join(HERE, "baseline.json")
+SIZES = (100, 10000, 1000000)
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    "Registers a function that sets up a benchmark and returns the callable to time"
+
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _range(size):
+    start = datetime(2016, 1, 1)
+    return DateRange(start, start + timedelta(minutes=size), timedelta(minutes=1))
+
+
+def _register_range_benchmarks(size):
+    # iterating a million points is too slow to repeat, the rest are size independent
+    if size <= 10000:
+
+        @benchmark("daterange.iter[{}]".format(size))
+        def iterate():
+            dr = _range(size)
+            return lambda: sum(1 for _ in dr)
+
+    @benchmark("daterange.len[{}]".format(size))
+    def length():
+        dr = _range(size)
+        return lambda: len(dr)
+
+    @benchmark("daterange.contains[{}]".format(size))
+    def contains():
+        dr = _range(size)
+        target = dr[size // 2]
+        return lambda: target in dr
+
+    @benchmark("daterange.getitem[{}]".format(size))
+    def getitem():
+        dr = _range(size)
+        idx = size // 2
+        return lambda: dr[idx]
+
+    @benchmark("daterange.slice[{}]".format(size))
+    def getslice():
+        dr = _range(size)
+        s = slice(size // 4, -size // 4, 3)
+        return lambda: dr[s]
+
+
+for _size in SIZES:
+    _register_range_benchmarks(_size)
+
+
+@benchmark("relativedate.compare")
+def relative_compare():
+    today = date(2016, 1, 1)
+    lower = RelativeDate(offset=timedelta(days=-30), clock=lambda: today)
+    upper = RelativeDate(clock=lambda: today)
+    value = date(2015, 12, 25)
+    return lambda: lower <= value < upper
+
+
+@benchmark("within_delta")
+def within():
+    d1, d2 = datetime(2016, 1, 1, 12), datetime(2016, 1, 1, 12, 0, 1)
+    delta = timedelta(seconds=5)
+    return lambda: within_delta(d1, d2, delta)
+
+
+def _import_time():
+    code = "import time; s = time.perf_counter(); import datestuff; "
+    code += "print(time.perf_counter() - s)"
+    env = dict(os.environ, PYTHONPATH=os.path.join(HERE, os.pardir, "src"))
+    output = subprocess.check_output([sys.executable, "-c", code], env=env)
+    return float(output)
+
+
+@benchmark("import")
+def package_import():
+    return _import_time
+
+
+def measure(setup, repeat=5):
+    func = setup()
+    if setup is package_import:
+        return min(func() for _ in range(repeat))
+
+    number, _ = timeit.Timer(func).autorange()
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def run(pattern=None):
+    results = {}
+    for name in sorted(BENCHMARKS):
+        if pattern is None or pattern in name:
+            results[name] = measure(BENCHMARKS[name])
+    return results
+
+
+def report(results, baseline, threshold):
+    "Prints a comparison table and returns the names of regressed benchmarks"
+    regressions = []
+    header = ("benchmark", "baseline", "current", "ratio")
+    print("{:<32} {:>12} {:>12} {:>8}".format(*header))
+
+    for name, current in sorted(results.items()):
+        previous = baseline.get(name)
+        if previous is None:
+            print("{:<32} {:>12} {:>12.3e} {:>8}".format(name, "-", current, "new"))
+            continue
+
+        ratio = current / previous
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  SLOWER"
+            regressions.append(name)
+        print(
+            "{:<32} {:>12.3e} {:>12.3e} {:>8.2f}{}".format(
+                name, previous, current, ratio, flag
+            )
+        )
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the datestuff benchmarks")
+    parser.add_argument("--save", help="write results to this file")
+    parser.add_argument("--baseline", default=BASELINE, help="results to compare to")
+    parser.add_argument("--filter", help="only run benchmarks containing this text")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="fraction slower than the baseline that counts as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.filter)
+
+    if args.save:
+        with open(args.save, "w") as fh:
+            json.dump(
+                {"python": platform.python_version(), "results": results},
+                fh,
+                indent=2,
+                sort_keys=True,
+            )
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)["results"]
+
+    return 1 if report(results, baseline, args.threshold) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
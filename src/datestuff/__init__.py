@@ -1,3 +1,65 @@
-from .relative import RelativeDate, RelativeDateTime  # noqa
-from .daterange import DateRange  # noqa
-from .utils import within_delta  # noqa
+import sys
+from importlib import import_module
+
+__all__ = [
+    "Bounds",
+    "BusinessCalendar",
+    "BusinessDayRange",
+    "CoarseClock",
+    "DateRange",
+    "RangeSet",
+    "RelativeDate",
+    "RelativeDateTime",
+    "Schedule",
+    "ZonedDateRange",
+    "asof_join",
+    "frozen_clock",
+    "tolerance_join",
+    "within_delta",
+]
+
+# exports are imported from their submodules on first access to keep imports fast
+_EXPORTS = {
+    "Bounds": "bounds",
+    "BusinessCalendar": "busday",
+    "BusinessDayRange": "busday",
+    "CoarseClock": "clock",
+    "DateRange": "daterange",
+    "RangeSet": "rangeset",
+    "RelativeDate": "relative",
+    "RelativeDateTime": "relative",
+    "Schedule": "schedule",
+    "ZonedDateRange": "zoned",
+    "asof_join": "utils",
+    "frozen_clock": "relative",
+    "tolerance_join": "utils",
+    "within_delta": "utils",
+}
+
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        try:
+            module = _EXPORTS[name]
+        except KeyError:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name)
+            )
+
+        value = globals()[name] = getattr(import_module("." + module, __name__), name)
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(_EXPORTS))
+
+
+else:  # pragma: no cover
+    from .relative import RelativeDate, RelativeDateTime, frozen_clock  # noqa
+    from .daterange import DateRange  # noqa
+    from .utils import asof_join, tolerance_join, within_delta  # noqa
+    from .zoned import ZonedDateRange  # noqa
+    from .busday import BusinessCalendar, BusinessDayRange  # noqa
+    from .rangeset import RangeSet  # noqa
+    from .schedule import Schedule  # noqa
+    from .bounds import Bounds  # noqa
+    from .clock import CoarseClock  # noqa
@@ -23,6 +23,8 @@ COMPARES = {
     for c in ["ge", "gt", "le", "lt", "eq", "ne"]
 }
 COMPARES["_compare"] = _compare
+# empty slots keep subclasses free to be slotted as well
+COMPARES["__slots__"] = ()
 
 ComparableMixin = ABCMeta("ComparableMixin", (object,), COMPARES)
 
@@ -0,0 +1,47 @@
+"""
+    datestuff._numpy
+    ~~~~~~~~~~~~~~~~
+    Optional NumPy support shared by the rest of the package. NumPy is only imported
+    when a feature that needs it is used, so it never slows down importing datestuff.
+    :copyright: 2016, Alec Reiter
+    :license: MIT, see LICENSE for more details
+"""
+import sys
+from datetime import datetime
+
+
+__all__ = ["require_numpy", "datetime64_unit", "is_array", "micros_since"]
+
+
+def require_numpy(feature):
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("{} requires numpy to be installed".format(feature))
+    return numpy
+
+
+def datetime64_unit(when):
+    """
+    Picks the datetime64 unit that represents ``when`` without loss: days for
+    dates and microseconds for datetimes.
+    """
+    if isinstance(when, datetime):
+        if when.tzinfo is not None:
+            raise ValueError("timezone aware values cannot be exported to datetime64")
+        return "us"
+    return "D"
+
+
+def is_array(value):
+    # if numpy hasn't been imported then value can't be an array
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def micros_since(values, origin):
+    "Converts a datetime64 array into int64 microseconds relative to origin"
+    np = require_numpy("datetime64 conversion")
+    datetime64_unit(origin)
+    origin = np.datetime64(origin, "us")
+    return (np.asarray(values).astype("datetime64[us]") - origin).astype("int64")
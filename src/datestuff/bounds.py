@@ -0,0 +1,88 @@
+"""
+    datestuff.bounds
+    ~~~~~~~~~~~~~~~~
+    Validates many values against relative bounds while reading the clock once
+    :copyright: 2016, Alec Reiter
+    :license: MIT, see LICENSE for more details
+"""
+import operator
+
+from .relative import _resolve, frozen_clock
+from ._numpy import datetime64_unit, is_array, require_numpy
+
+__all__ = ["Bounds"]
+
+
+class Bounds(object):
+    """
+    A compiled check of lower <= value < upper where either bound may be a
+    RelativeDate, a RelativeDateTime, a plain date or datetime, or None for no
+    bound. Whether each end is inclusive is configurable.
+
+    Comparing values against relative instances directly calls their clock for every
+    comparison. Bounds resolves the bounds once per call instead, inside
+    frozen_clock so bounds sharing a clock see the same moment, and then checks
+    every value against the resolved bounds. mask does this for a whole batch, in a
+    single vectorized pass for a datetime64 array.
+    """
+
+    __slots__ = ("lower", "upper", "lower_inclusive", "upper_inclusive")
+
+    def __init__(
+        self, lower=None, upper=None, lower_inclusive=True, upper_inclusive=False
+    ):
+        self.lower = lower
+        self.upper = upper
+        self.lower_inclusive = lower_inclusive
+        self.upper_inclusive = upper_inclusive
+
+    def __repr__(self):
+        return "{!s}({!r}, {!r}, lower_inclusive={!r}, upper_inclusive={!r})".format(
+            self.__class__.__name__,
+            self.lower,
+            self.upper,
+            self.lower_inclusive,
+            self.upper_inclusive,
+        )
+
+    def resolve(self):
+        "The current (lower, upper) bounds as plain values"
+        with frozen_clock():
+            return _resolve(self.lower), _resolve(self.upper)
+
+    def _operators(self):
+        above = operator.le if self.lower_inclusive else operator.lt
+        below = operator.le if self.upper_inclusive else operator.lt
+        return above, below
+
+    def __contains__(self, value):
+        return self.mask([value])[0]
+
+    def mask(self, values):
+        """
+        Checks every value against the bounds, resolved once for the whole batch.
+        Returns a boolean NumPy array for a datetime64 array and a list of booleans
+        for any other iterable.
+        """
+        lower, upper = self.resolve()
+        above, below = self._operators()
+
+        if is_array(values):
+            return self._mask_array(values, lower, upper, above, below)
+
+        return [
+            (lower is None or above(lower, value))
+            and (upper is None or below(value, upper))
+            for value in values
+        ]
+
+    @staticmethod
+    def _mask_array(values, lower, upper, above, below):
+        np = require_numpy("Bounds.mask")
+        mask = np.ones(len(values), dtype=bool)
+
+        if lower is not None:
+            mask &= above(np.datetime64(lower, datetime64_unit(lower)), values)
+        if upper is not None:
+            mask &= below(values, np.datetime64(upper, datetime64_unit(upper)))
+        return mask
@@ -0,0 +1,300 @@
+"""
+    datestuff.busday
+    ~~~~~~~~~~~~~~~~
+    Business day calendars and ranges over business days
+    :copyright: 2016, Alec Reiter
+    :license: MIT, see LICENSE for more details
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from itertools import count
+
+from .daterange import DateRange, _set
+from ._numpy import require_numpy
+from .relative import _resolve, frozen_clock
+
+__all__ = ["BusinessCalendar", "BusinessDayRange"]
+
+# days are counted from date(1, 1, 1), which is a Monday
+_UNIX_DAY = date(1970, 1, 1).toordinal() - 1
+
+
+def _day(when):
+    return when.toordinal() - 1
+
+
+def _weekmask(mask):
+    if isinstance(mask, str):
+        if len(mask) != 7 or set(mask) - set("01"):
+            raise ValueError(
+                "weekmask must be seven 0 or 1 characters, not {!r}".format(mask)
+            )
+        mask = [c == "1" for c in mask]
+
+    mask = tuple(bool(flag) for flag in mask)
+    if len(mask) != 7:
+        raise ValueError("weekmask must have an entry for each day of the week")
+    if not any(mask):
+        raise ValueError("weekmask must contain at least one business day")
+    return mask
+
+
+class BusinessCalendar(object):
+    """
+    Describes which days are business days with a weekmask, seven flags starting on
+    Monday given as a string such as "1111100" or a sequence of booleans, and a
+    collection of holiday dates.
+
+    Business days are numbered by counting whole weeks and looking up the day within
+    the week, holidays are accounted for by bisecting the sorted holidays so every
+    operation is O(log holidays) no matter how far apart the dates are.
+    """
+
+    __slots__ = (
+        "weekmask",
+        "holidays",
+        "_weekdays",
+        "_before",
+        "_holidays",
+        "_shifted",
+    )
+
+    def __init__(self, weekmask="1111100", holidays=()):
+        mask = _weekmask(weekmask)
+        # holidays on days that aren't business days anyway change nothing
+        days = sorted({_day(h) for h in holidays if mask[h.weekday()]})
+
+        self.weekmask = mask
+        self.holidays = tuple(date.fromordinal(d + 1) for d in days)
+        self._weekdays = [weekday for weekday in range(7) if mask[weekday]]
+        # business days in a week before each weekday
+        self._before = [sum(mask[:weekday]) for weekday in range(8)]
+        self._holidays = days
+        # the number each holiday would have had, less the holidays before it
+        self._shifted = [self._rank_weeks(d) - i for i, d in enumerate(days)]
+
+    def __reduce__(self):
+        return BusinessCalendar, (self.weekmask, self.holidays)
+
+    def __repr__(self):
+        return "{!s}(weekmask={!r}, holidays={!r})".format(
+            self.__class__.__name__,
+            "".join("1" if flag else "0" for flag in self.weekmask),
+            self.holidays,
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, BusinessCalendar):
+            return (self.weekmask, self._holidays) == (other.weekmask, other._holidays)
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, BusinessCalendar):
+            return not self == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.weekmask, tuple(self._holidays)))
+
+    def _rank_weeks(self, day):
+        "Business days before day ignoring holidays"
+        weeks, weekday = divmod(day, 7)
+        return weeks * self._before[7] + self._before[weekday]
+
+    def _rank(self, day):
+        "Business days before day, which is also the number of day if it is one"
+        return self._rank_weeks(day) - bisect_left(self._holidays, day)
+
+    def _unrank(self, number):
+        "Inverse of _rank, the day of the business day with the given number"
+        number += bisect_right(self._shifted, number)
+        weeks, idx = divmod(number, self._before[7])
+        return weeks * 7 + self._weekdays[idx]
+
+    def _is_busday(self, day):
+        idx = bisect_left(self._holidays, day)
+        return self.weekmask[day % 7] and (
+            idx == len(self._holidays) or self._holidays[idx] != day
+        )
+
+    def _ranks(self, np, days):
+        weeks, weekdays = np.divmod(days, 7)
+        before = np.array(self._before, dtype="int64")
+        holidays = np.array(self._holidays, dtype="int64")
+        return (
+            weeks * self._before[7]
+            + before[weekdays]
+            - np.searchsorted(holidays, days, side="left")
+        )
+
+    def _unranks(self, np, numbers):
+        shifted = np.array(self._shifted, dtype="int64")
+        weekdays = np.array(self._weekdays, dtype="int64")
+        numbers = numbers + np.searchsorted(shifted, numbers, side="right")
+        weeks, idx = np.divmod(numbers, self._before[7])
+        return weeks * 7 + weekdays[idx]
+
+    def is_busday(self, when):
+        "Checks if when falls on a business day"
+        return self._is_busday(_day(when))
+
+    def count(self, begin, end):
+        "Business days from begin up to but excluding end, negative if end comes first"
+        return self._rank(_day(end)) - self._rank(_day(begin))
+
+    def offset(self, when, days, roll="forward"):
+        """
+        Moves when by a number of business days. When it isn't a business day itself
+        it is first rolled to the following business day ("forward"), the preceding
+        one ("backward") or a ValueError is raised ("raise").
+        """
+        day = _day(when)
+        number = self._rank(day)
+
+        if not self._is_busday(day):
+            if roll == "backward":
+                number -= 1
+            elif roll != "forward":
+                raise ValueError("{!r} is not a business day".format(when))
+
+        return date.fromordinal(self._unrank(number + days) + 1)
+
+
+class BusinessDayRange(DateRange):
+    """
+    A DateRange over the business days of a BusinessCalendar, by default Monday to
+    Friday without holidays. The step is a whole number of business days and a start
+    that isn't a business day is rolled onto the next one in the direction of the
+    step.
+
+    Each business day has a number that is computed from the calendar, so length,
+    indexing, slicing and membership are O(log holidays) rather than walking every
+    day of the range. Set operations are not supported.
+    """
+
+    __slots__ = ("calendar", "_first")
+
+    def __init__(self, start=None, stop=None, step=1, calendar=None):
+        if start is None:
+            raise TypeError("must provide starting point for BusinessDayRange.")
+
+        # relative bounds are resolved once, at the same moment
+        with frozen_clock():
+            start, stop = _resolve(start), _resolve(stop)
+
+        if isinstance(start, datetime) or isinstance(stop, datetime):
+            raise TypeError("BusinessDayRange works on dates, not datetimes")
+        if not step:
+            raise TypeError("must provide non-zero step for BusinessDayRange")
+
+        calendar = calendar or BusinessCalendar()
+        day = _day(start)
+        first = calendar._rank(day)
+
+        if step < 0 and not calendar._is_busday(day):
+            first -= 1
+
+        _set(self, "start", date.fromordinal(calendar._unrank(first) + 1))
+        _set(self, "stop", stop)
+        _set(self, "step", step)
+        _set(self, "calendar", calendar)
+        _set(self, "_first", first)
+        _set(self, "_months", None)
+        _set(self, "_step_us", None)
+        _set(self, "_month_day", None)
+        _set(self, "_first_month", None)
+        _set(self, "_len", None if stop is None else max(0, self._ceil_index(stop)))
+
+    def __reduce__(self):
+        return BusinessDayRange, (self.start, self.stop, self.step, self.calendar)
+
+    def __repr__(self):
+        return "{!s}(start={!r}, stop={!r}, step={!r}, calendar={!r})".format(
+            self.__class__.__name__, self.start, self.stop, self.step, self.calendar
+        )
+
+    def __reversed__(self):
+        if self.stop:
+            return BusinessDayRange(self.stop, self.start, -self.step, self.calendar)
+
+        raise ValueError("Cannot reverse infinite range")
+
+    def _derive(self, start, stop, step):
+        return BusinessDayRange(start, stop, step, self.calendar)
+
+    def _key(self):
+        key = super(BusinessDayRange, self)._key()
+        if len(key) < 3:
+            return key
+        return self._len, self.start, self.step, self.calendar
+
+    @property
+    def _forward(self):
+        return self.step > 0
+
+    def _point(self, idx):
+        day = self.calendar._unrank(self._first + self.step * idx)
+        return date.fromordinal(day + 1)
+
+    def _index(self, number, ceil):
+        "Index of a business day number, rounded up or down to a point of the range"
+        if ceil:
+            return -(-(number - self._first) // self.step)
+        return (number - self._first) // self.step
+
+    def _floor_index(self, x):
+        # the last business day at or before x when stepping forward, else at or after
+        number = self.calendar._rank(_day(x) + self._forward) - self._forward
+        return self._index(number, ceil=False)
+
+    def _ceil_index(self, x):
+        backward = not self._forward
+        number = self.calendar._rank(_day(x) + backward) - backward
+        return self._index(number, ceil=True)
+
+    def _position(self, x):
+        day = _day(x)
+        if not self.calendar._is_busday(day):
+            return None
+
+        idx, remainder = divmod(self.calendar._rank(day) - self._first, self.step)
+        if remainder or idx < 0 or (self._len is not None and idx >= self._len):
+            return None
+        return idx
+
+    def __iter__(self):
+        indices = count() if self._len is None else range(self._len)
+        for idx in indices:
+            yield self._point(idx)
+
+    def _bounds(self, origin):
+        raise TypeError("set operations are not supported by BusinessDayRange")
+
+    def _days(self, np, values):
+        "Days since date(1, 1, 1) of a datetime64 array"
+        return np.asarray(values).astype("datetime64[D]").astype("int64") + _UNIX_DAY
+
+    def _positions(self, values):
+        np = require_numpy("BusinessDayRange batch lookups")
+        days = self._days(np, values)
+        numbers = self.calendar._ranks(np, days)
+        idx, remainder = np.divmod(numbers - self._first, self.step)
+
+        # a day is a business day if the next day has a higher number
+        found = (self.calendar._ranks(np, days + 1) > numbers) & (remainder == 0)
+        found &= idx >= 0
+        if self._len is not None:
+            found &= idx < self._len
+        return idx, found
+
+    def _grid_indices(self, values, feature, ceil):
+        np = require_numpy(feature)
+        # see _floor_index and _ceil_index
+        after = self._forward != ceil
+        numbers = self.calendar._ranks(np, self._days(np, values) + after) - after
+        return self._index(numbers, ceil)
+
+    def _points(self, indices):
+        np = require_numpy("BusinessDayRange.to_numpy")
+        days = self.calendar._unranks(np, self._first + indices * self.step)
+        return (days - _UNIX_DAY).astype("datetime64[D]")
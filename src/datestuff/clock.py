@@ -0,0 +1,111 @@
+"""
+    datestuff.clock
+    ~~~~~~~~~~~~~~~
+    Coarse clock that trades precision for cheap reads
+    :copyright: 2016, Alec Reiter
+    :license: MIT, see LICENSE for more details
+"""
+import threading
+
+from .relative import NOW_DT
+
+__all__ = ["CoarseClock"]
+
+
+class CoarseClock(object):
+    """
+    A clock for RelativeDateTime (or anything else taking a clock factory) that
+    returns a shared, cached datetime instead of calling datetime.now every time.
+    The cached value is refreshed every resolution seconds either by a daemon thread
+    (start()) or by callbacks on an asyncio event loop (start(loop)).
+
+    While running, a value is at most resolution seconds old plus however long the
+    refresh is held up: by the GIL for the thread, which Python hands over every
+    sys.getswitchinterval() seconds (5ms by default), or by callbacks blocking the
+    event loop. When it isn't running every call goes straight to factory, so the
+    clock is never stale.
+
+    Reads only load a reference to an immutable datetime, so the clock can be shared
+    between threads without locking. start and stop should be called from one
+    thread, or from the loop's thread when refreshing on an event loop.
+
+        clock = CoarseClock(resolution=0.001)
+        clock.start()
+        recent = RelativeDateTime(offset=timedelta(minutes=-5), clock=clock)
+    """
+
+    __slots__ = ("resolution", "_factory", "_now", "_stopped", "_thread", "_handle")
+
+    def __init__(self, resolution=0.001, factory=NOW_DT):
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        self.resolution = resolution
+        self._factory = factory
+        self._now = None
+        self._stopped = None
+        self._thread = None
+        self._handle = None
+
+    def __repr__(self):
+        return "<{} resolution={!r} running={!r}>".format(
+            self.__class__.__name__, self.resolution, self.running
+        )
+
+    def __call__(self):
+        now = self._now
+        if now is None:
+            return self._factory()
+        return now
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def running(self):
+        return self._thread is not None or self._handle is not None
+
+    def start(self, loop=None):
+        """
+        Starts refreshing the cached value, on a daemon thread or on loop when it is
+        given. The value is refreshed before returning.
+        """
+        if self.running:
+            raise RuntimeError("clock is already running")
+
+        self._now = self._factory()
+
+        if loop is not None:
+            self._handle = loop.call_later(self.resolution, self._tick, loop)
+            return
+
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._refresh, args=(self._stopped,), name="CoarseClock"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        "Stops refreshing, afterwards every call goes to factory again"
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = self._stopped = None
+
+        self._now = None
+
+    def _refresh(self, stopped):
+        while not stopped.wait(self.resolution):
+            self._now = self._factory()
+
+    def _tick(self, loop):
+        self._now = self._factory()
+        self._handle = loop.call_later(self.resolution, self._tick, loop)
@@ -1,19 +1,139 @@
-from __future__ import division
-from math import ceil
 from datetime import timedelta
+from itertools import count, repeat
+from numbers import Integral
+
+try:
+    from math import gcd
+except ImportError:  # pragma: no cover
+    from fractions import gcd
+
+from ._numpy import datetime64_unit, is_array, micros_since, require_numpy
+from .instrumentation import slow_path
+from .relative import _resolve, frozen_clock
 
 __all__ = ("DateRange",)
 
 
+_set = object.__setattr__
+
+
+def _micros(delta):
+    "Exact integer number of microseconds in a timedelta like object"
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+# fields that make a relativedelta step something other than a whole number of months
+_NON_CALENDAR_FIELDS = (
+    "days",
+    "hours",
+    "minutes",
+    "seconds",
+    "microseconds",
+    "leapdays",
+    "year",
+    "month",
+    "day",
+    "weekday",
+    "hour",
+    "minute",
+    "second",
+    "microsecond",
+)
+
+
+def _calendar_months(step):
+    """
+    Total months in a relativedelta like step or None if the step isn't calendar based.
+    Only steps made of years and months are supported.
+    """
+    years, months = getattr(step, "years", None), getattr(step, "months", None)
+
+    if years is None or months is None:
+        return None
+    if any(getattr(step, field, None) for field in _NON_CALENDAR_FIELDS):
+        raise TypeError("calendar steps may only use years and months")
+    return years * 12 + months
+
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year, month):
+    # the calendar module would do but importing it pulls in locale and re
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+def _month_number(when):
+    return when.year * 12 + when.month - 1
+
+
+def _time_of_day(when):
+    "Time elapsed since midnight as a timedelta, always zero for dates"
+    return timedelta(
+        hours=getattr(when, "hour", 0),
+        minutes=getattr(when, "minute", 0),
+        seconds=getattr(when, "second", 0),
+        microseconds=getattr(when, "microsecond", 0),
+    )
+
+
+def _modinv(value, modulus):
+    "Inverse of value modulo modulus, value and modulus must be coprime"
+    if modulus == 1:
+        return 0
+    old_r, r, old_s, s = value % modulus, modulus, 1, 0
+    while r:
+        quotient = old_r // r
+        old_r, r = r, old_r - quotient * r
+        old_s, s = s, old_s - quotient * s
+    return old_s % modulus
+
+
+def _bounded(pick, *values):
+    "Applies pick to the values that are not None, None stands for unbounded"
+    values = [v for v in values if v is not None]
+    return pick(values) if values else None
+
+
+def _gap(high, low, step):
+    "Checks if there are missing grid points between high and a following low"
+    return high is not None and low is not None and low - high > step
+
+
 class DateRange(object):
     """
     Creates a lazy range of date or datetimes. Modeled after the Python 3 range type and has
     fast path membership checking, lazy iteration, indexing and slicing. Unlike range, DateRange
     allows an open ended range. Also unlike range, it does not have an implicit step so it must be
     provided.
+
+    Internally the range is kept as integer microseconds (the step and the length) so
+    that length, membership, indexing and slicing are exact regardless of how far apart
+    the start and stop are.
+
+    The step may also be a relativedelta made of only years and months, in which case
+    the points are computed from month numbers. month_day picks the day of the month
+    each point falls on, it defaults to the day of start and is clamped to the length of
+    each month, -1 always picks the last day of the month.
+
+    DateRange is immutable and slotted to keep instances small. A RelativeDate or
+    RelativeDateTime start or stop is resolved when the range is created.
     """
 
-    def __init__(self, start=None, stop=None, step=None):
+    __slots__ = (
+        "start",
+        "stop",
+        "step",
+        "_months",
+        "_step_us",
+        "_month_day",
+        "_first_month",
+        "_len",
+    )
+
+    def __init__(self, start=None, stop=None, step=None, month_day=None):
         if step is None:
             raise TypeError("must provide step for DateRange.")
         if step == timedelta(0):
@@ -21,10 +141,49 @@ class DateRange(object):
         if start is None:
             raise TypeError("must provide starting point for DateRange.")
 
-        self.start = start
-        self.stop = stop
-        self.step = step
-        self._has_neg_step = self.step < timedelta(0)
+        # relative bounds are resolved once, at the same moment
+        with frozen_clock():
+            start, stop = _resolve(start), _resolve(stop)
+
+        _set(self, "start", start)
+        _set(self, "stop", stop)
+        _set(self, "step", step)
+        _set(self, "_months", _calendar_months(step))
+
+        if self._months is None:
+            if month_day is not None:
+                raise TypeError("month_day requires a calendar step")
+            _set(self, "_step_us", _micros(step))
+            _set(self, "_month_day", None)
+            _set(self, "_first_month", None)
+        else:
+            if not self._months:
+                raise TypeError("must provide non-zero step for DateRange")
+            if month_day not in (None, -1) and not 1 <= month_day <= 31:
+                raise ValueError(
+                    "month_day must be between 1 and 31 or -1, "
+                    "not {!r}".format(month_day)
+                )
+            _set(self, "_step_us", None)
+            _set(self, "_month_day", start.day if month_day is None else month_day)
+            _set(self, "_first_month", _month_number(start))
+
+            if self._point(0) != start:
+                raise ValueError("start does not fall on month_day")
+
+        _set(self, "_len", None if stop is None else max(0, self._ceil_index(stop)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DateRange is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("DateRange is immutable")
+
+    def __reduce__(self):
+        # only the constructor arguments are pickled, everything else is derived
+        if self._month_day is None:
+            return DateRange, (self.start, self.stop, self.step)
+        return DateRange, (self.start, self.stop, self.step, self._month_day)
 
     def __repr__(self):
         return "{!s}(start={!r}, stop={!r}, step={!r}".format(
@@ -38,67 +197,564 @@ class DateRange(object):
         raise ValueError("Cannot reverse infinite range")
 
     def __len__(self):
-        if self.stop is None:
+        if self._len is None:
             # it'd be nice if float('inf') could be returned
             raise TypeError("infinite range")
 
-        if self._has_neg_step:
-            calc = self.start - self.stop
+        return self._len
+
+    def __contains__(self, x):
+        return self._position(x) is not None
+
+    def _point(self, idx):
+        if self._months is None:
+            return self.start + self.step * idx
+
+        year, month = divmod(self._first_month + self._months * idx, 12)
+        days = _days_in_month(year, month + 1)
+        day = days if self._month_day == -1 else min(self._month_day, days)
+        return self.start.replace(year=year, month=month + 1, day=day)
+
+    @property
+    def _forward(self):
+        return (self._step_us or self._months) > 0
+
+    def _before(self, a, b):
+        "Checks if a comes before b in the order of the range"
+        return a < b if self._forward else a > b
+
+    def _floor_index(self, x):
+        "Index of the last point at or before x, may fall outside the range"
+        if self._months is None:
+            return _micros(x - self.start) // self._step_us
+
+        idx = (_month_number(x) - self._first_month) // self._months
+        return idx - 1 if self._before(x, self._point(idx)) else idx
+
+    def _ceil_index(self, x):
+        "Index of the first point at or after x, may fall outside the range"
+        if self._months is None:
+            # ceiling division, works for either sign of step
+            return -(-_micros(x - self.start) // self._step_us)
+
+        idx = -(-(_month_number(x) - self._first_month) // self._months)
+        return idx + 1 if self._before(self._point(idx), x) else idx
+
+    def _fixed_step(self, feature):
+        # calendar steps and ranges stepping over business days have no _step_us
+        if self._step_us is None:
+            raise TypeError("{} requires a fixed length step".format(feature))
+
+    def _position(self, x):
+        "Index of x in the range or None if x is not one of its points"
+        if self._months is None:
+            idx, remainder = divmod(_micros(x - self.start), self._step_us)
+        else:
+            idx = self._floor_index(x)
+            remainder = self._point(idx) != x
+
+        if remainder or idx < 0 or (self._len is not None and idx >= self._len):
+            return None
+        return idx
+
+    def _as_objects(self, values, feature):
+        "Converts a datetime64 array into dates or datetimes matching the range"
+        slow_path(feature)
+        unit = datetime64_unit(self.start)
+        return values.astype("datetime64[{}]".format(unit)).astype(object)
+
+    def _offsets(self, values):
+        "Microseconds from the start for each value of a datetime64 array"
+        return micros_since(values, self.start)
+
+    def _grid_indices(self, values, feature, ceil):
+        "Vectorized _floor_index, or _ceil_index when ceil is true"
+        np = require_numpy(feature)
+
+        if self._months is not None:
+            index = self._ceil_index if ceil else self._floor_index
+            objects = self._as_objects(values, feature)
+            return np.array([index(x) for x in objects], dtype="int64")
+
+        if ceil:
+            return -(-self._offsets(values) // self._step_us)
+        return self._offsets(values) // self._step_us
+
+    def _positions(self, values):
+        "Vectorized _position, returns the indices and a mask of which are valid"
+        np = require_numpy("DateRange batch lookups")
+
+        if self._months is not None:
+            objects = self._as_objects(values, "DateRange.lookup")
+            positions = [self._position(x) for x in objects]
+            found = np.array([idx is not None for idx in positions], dtype=bool)
+            return np.array([idx or 0 for idx in positions], dtype="int64"), found
+
+        idx, remainder = np.divmod(self._offsets(values), self._step_us)
+        found = (remainder == 0) & (idx >= 0)
+
+        if self._len is not None:
+            found &= idx < self._len
+        return idx, found
+
+    def index(self, x):
+        """
+        Returns the position of x in the range, raises ValueError if x isn't in
+        the range. Accepts a datetime64 array to look up many values at once.
+        """
+        if is_array(x):
+            idx, found = self._positions(x)
+            if not found.all():
+                raise ValueError("not all values are in range")
+            return idx
+
+        idx = self._position(x)
+        if idx is None:
+            raise ValueError("{!r} is not in range".format(x))
+        return idx
+
+    def count(self, x):
+        "Number of times x occurs in the range, either 0 or 1"
+        if is_array(x):
+            return self._positions(x)[1].astype("int64")
+        return int(x in self)
+
+    def searchsorted(self, x, side="left"):
+        """
+        Returns the position x would be inserted at to keep the range's order, x
+        doesn't need to be in the range. With side="left" the position is before
+        a matching point and with side="right" it is after it. Accepts a
+        datetime64 array to look up many values at once.
+        """
+        if side not in ("left", "right"):
+            raise ValueError("side must be 'left' or 'right', not {!r}".format(side))
+
+        if not is_array(x):
+            pos = self._ceil_index(x) if side == "left" else self._floor_index(x) + 1
+            return _bounded(min, max(pos, 0), self._len)
+
+        np = require_numpy("DateRange.searchsorted")
+
+        if side == "left":
+            pos = self._grid_indices(x, "DateRange.searchsorted", ceil=True)
         else:
-            calc = self.stop - self.start
+            pos = self._grid_indices(x, "DateRange.searchsorted", ceil=False) + 1
 
-        return int(ceil(abs(calc.total_seconds() / self.step.total_seconds())))
+        return np.clip(pos, 0, self._len)
 
-    def __contains__(self, x):
-        if self.stop is not None:
-            if self._has_neg_step:
-                check = self.start >= x > self.stop
-            else:
-                check = self.start <= x < self.stop
+    def __iter__(self):
+        if self._months is not None:
+            # calendar points are computed from the start to avoid drifting month ends
+            indices = count() if self._len is None else range(self._len)
+            for idx in indices:
+                yield self._point(idx)
+            return
+
+        current = self.start
+        step = self.step
+
+        if self._len is None:
+            while True:
+                yield current
+                current = current + step
+
+        for _ in repeat(None, self._len):
+            yield current
+            current = current + step
+
+    def _bounds(self, origin):
+        """
+        Describes the points of the range as (lowest, highest, step) in integer
+        microseconds from origin, regardless of direction. Unbounded ends are None
+        and an empty range is None altogether.
+        """
+        self._fixed_step("set operations")
+
+        if self._len == 0:
+            return None
+
+        base = _micros(self.start - origin)
+        step = abs(self._step_us)
+
+        if self._len is None:
+            return (base, None, step) if self._step_us > 0 else (None, base, step)
+
+        end = base + self._step_us * (self._len - 1)
+        return min(base, end), max(base, end), step
+
+    def _from_bounds(self, origin, lowest, highest, step):
+        "Inverse of _bounds, keeps the direction of this range where possible"
+        if lowest is not None and (self._step_us > 0 or highest is None):
+            start, last, step = lowest, highest, timedelta(microseconds=step)
         else:
-            if self._has_neg_step:
-                check = self.start >= x
-            else:
-                check = self.start <= x
+            start, last, step = highest, lowest, timedelta(microseconds=-step)
+
+        start = origin + timedelta(microseconds=start)
+        if last is not None:
+            last = origin + timedelta(microseconds=last) + step
+
+        return DateRange(start=start, stop=last, step=step)
+
+    def _derive(self, start, stop, step):
+        "Creates a range sharing the calendar settings of this one"
+        return DateRange(start=start, stop=stop, step=step, month_day=self._month_day)
+
+    def _empty(self):
+        return self._derive(self.start, self.start, self.step)
+
+    def _intersect_bounds(self, other, origin):
+        ours, theirs = self._bounds(origin), other._bounds(origin)
+
+        if ours is None or theirs is None:
+            return None
+
+        (a_low, a_high, a_step), (b_low, b_high, b_step) = ours, theirs
+        a_point = a_high if a_low is None else a_low
+        b_point = b_high if b_low is None else b_low
+        divisor = gcd(a_step, b_step)
+
+        if (b_point - a_point) % divisor:
+            return None
+
+        # chinese remainder theorem for the first point shared by both grids
+        modulus = b_step // divisor
+        k = (b_point - a_point) // divisor * _modinv(a_step // divisor, modulus)
+        shared = a_point + a_step * (k % modulus)
+        step = a_step * modulus
+
+        lowest = _bounded(max, a_low, b_low)
+        highest = _bounded(min, a_high, b_high)
+
+        if lowest is not None:
+            lowest += (shared - lowest) % step
+        if highest is not None:
+            highest -= (highest - shared) % step
+        if lowest is not None and highest is not None and lowest > highest:
+            return None
+
+        return lowest, highest, step
+
+    def intersection(self, other):
+        """
+        Returns the points shared by both ranges as a new DateRange, computed
+        arithmetically without iterating either range.
+        """
+        bounds = self._intersect_bounds(other, self.start)
+        if bounds is None:
+            return self._empty()
+        return self._from_bounds(self.start, *bounds)
+
+    def isdisjoint(self, other):
+        return self._intersect_bounds(other, self.start) is None
+
+    def issubset(self, other):
+        "Checks if every point in this range is also in the other range"
+        ours = self._bounds(self.start)
+        if ours is None:
+            return True
+
+        theirs = other._bounds(self.start)
+        if theirs is None:
+            return False
+
+        (a_low, a_high, a_step), (b_low, b_high, b_step) = ours, theirs
+        a_point = a_high if a_low is None else a_low
+        b_point = b_high if b_low is None else b_low
 
-        if not check:
+        if a_low != a_high and a_step % b_step:
             return False
 
-        difference = x - self.start
+        return (
+            (a_point - b_point) % b_step == 0
+            and (b_low is None or (a_low is not None and a_low >= b_low))
+            and (b_high is None or (a_high is not None and a_high <= b_high))
+        )
+
+    def issuperset(self, other):
+        return other.issubset(self)
+
+    def union(self, other):
+        """
+        Combines two ranges into one. This is best effort, the points of both
+        ranges must fit on a single grid without gaps otherwise ValueError is raised.
+        """
+        if other.issubset(self):
+            return self[:]
+
+        origin = self.start
+        theirs = other._bounds(origin)
+        if self.issubset(other):
+            return self._from_bounds(origin, *theirs)
+
+        (a_low, a_high, a_step), (b_low, b_high, b_step) = self._bounds(origin), theirs
+
+        # a single point fits on any grid
+        if a_low == a_high:
+            a_step = b_step if b_low != b_high else abs(b_low - a_low)
+        if b_low == b_high:
+            b_step = a_step
+
+        a_point = a_high if a_low is None else a_low
+        b_point = b_high if b_low is None else b_low
+
+        if (
+            a_step != b_step
+            or (a_point - b_point) % a_step
+            or _gap(a_high, b_low, a_step)
+            or _gap(b_high, a_low, a_step)
+        ):
+            raise ValueError("union cannot be represented as a single DateRange")
+
+        lowest = None if a_low is None or b_low is None else min(a_low, b_low)
+        highest = None if a_high is None or b_high is None else max(a_high, b_high)
+        if lowest is None and highest is None:
+            raise ValueError("union is unbounded in both directions")
+        return self._from_bounds(origin, lowest, highest, a_step)
+
+    def difference(self, other):
+        """
+        Removes the points of other from this range. This is best effort, the
+        remaining points must form a single range otherwise ValueError is raised.
+        """
+        origin = self.start
+        shared = self._intersect_bounds(other, origin)
+
+        if shared is None:
+            return self[:]
+        if self.issubset(other):
+            return self._empty()
+
+        a_low, a_high, step = self._bounds(origin)
+        s_low, s_high, s_step = shared
+
+        if s_step == step:
+            if s_low == a_low:
+                return self._from_bounds(origin, s_high + step, a_high, step)
+            if s_high == a_high:
+                return self._from_bounds(origin, a_low, s_low - step, step)
+
+        raise ValueError("difference cannot be represented as a single DateRange")
+
+    def _snap(self, x, feature, up):
+        # moving forward in time is moving up the indices only for positive steps
+        ceil = up == self._forward
+
+        if is_array(x):
+            return self._points(self._grid_indices(x, feature, ceil=ceil))
+        return self._point(self._ceil_index(x) if ceil else self._floor_index(x))
+
+    def floor(self, x):
+        """
+        Snaps x to the latest point of the range's grid at or before it. The grid
+        continues past either end of the range, so any value can be snapped. Accepts
+        a datetime64 array to snap many values at once.
+        """
+        return self._snap(x, "DateRange.floor", up=False)
+
+    def ceil(self, x):
+        "Snaps x to the earliest grid point at or after it, see floor"
+        return self._snap(x, "DateRange.ceil", up=True)
+
+    def round(self, x):
+        "Snaps x to the nearest grid point, halfway values go to the later one"
+        lower, upper = self.floor(x), self.ceil(x)
+
+        if not is_array(x):
+            return lower if x - lower < upper - x else upper
+
+        np = require_numpy("DateRange.round")
+        values = np.asarray(x).astype("datetime64[us]")
+        closer = values - lower.astype("datetime64[us]") < upper - values
+        return np.where(closer, lower, upper)
+
+    def bucket_of(self, x):
+        """
+        Treats each point as the start of a bucket that runs until the next point and
+        returns the index of the bucket containing x, or None when x is outside of the
+        range. The last bucket of a finite range is a full step long.
+        """
+        idx = self._floor_index(x)
+
+        if idx < 0 or (self._len is not None and idx >= self._len):
+            return None
+        return idx
+
+    def bucketize(self, values):
+        """
+        Vectorized bucket_of over a datetime64 array or an iterable of dates or
+        datetimes. Returns an int64 array of bucket indices, -1 where a value is
+        outside of the range.
+        """
+        np = require_numpy("DateRange.bucketize")
+
+        if self._months is not None:
+            if is_array(values):
+                values = self._as_objects(values, "DateRange.bucketize")
+            else:
+                slow_path("DateRange.bucketize")
+            buckets = [self.bucket_of(x) for x in values]
+            return np.array([-1 if b is None else b for b in buckets], dtype="int64")
+
+        if not is_array(values):
+            values = np.array(list(values), dtype="datetime64[us]")
+
+        buckets = self._grid_indices(values, "DateRange.bucketize", ceil=False)
+        outside = buckets < 0
+        if self._len is not None:
+            outside |= buckets >= self._len
+
+        buckets[outside] = -1
+        return buckets
+
+    def histogram(self, values):
+        """
+        Counts how many values fall into each bucket of a finite range, see bucketize.
+        Values outside of the range are ignored.
+        """
+        np = require_numpy("DateRange.histogram")
+        buckets = self.bucketize(values)
+        return np.bincount(buckets[buckets >= 0], minlength=len(self))
+
+    def chunks(self, size):
+        """
+        Lazily yields consecutive sub ranges of at most size points each. Works with
+        infinite ranges, in which case the chunks never run out.
+        """
+        if size < 1:
+            raise ValueError("chunk size must be positive")
+
+        if self._len is None:
+            lowers = count(0, size)
+        else:
+            lowers = range(0, self._len, size)
+
+        return (self[slice(lower, lower + size)] for lower in lowers)
 
-        return difference.total_seconds() % self.step.total_seconds() == 0
+    def split(self, parts):
+        """
+        Splits the range into parts consecutive sub ranges whose lengths differ by at
+        most one. Some parts are empty when there are fewer points than parts.
+        """
+        if parts < 1:
+            raise ValueError("number of parts must be positive")
 
-    def _check_stop(self, current):
-        if self._has_neg_step:
-            return current <= self.stop
-        return current >= self.stop
+        size, remainder = divmod(len(self), parts)
 
-    def __iter__(self):
-        current = self.start
-        stopping = self.stop is not None
+        def lower(part):
+            # the first remainder parts get one extra point each
+            return part * size + min(part, remainder)
 
-        while True:
-            if stopping and self._check_stop(current):
-                break
-            yield current
-            current = current + self.step
+        return (self[slice(lower(part), lower(part + 1))] for part in range(parts))
+
+    def windows(self, size, stride=1):
+        """
+        Lazily yields overlapping sub ranges of exactly size points, each starting
+        stride points after the previous one.
+        """
+        if size < 1 or stride < 1:
+            raise ValueError("window size and stride must be positive")
+
+        if self._len is None:
+            starts = count(0, stride)
+        else:
+            starts = range(0, max(self._len - size + 1, 0), stride)
+
+        return (self[slice(lower, lower + size)] for lower in starts)
+
+    def aticks(self, clock=None, sleep=None):
+        """
+        Asynchronous iterator that sleeps until each point of the range is reached
+        according to clock and then yields it. Ticks that were missed are skipped,
+        only the most recent overdue point is yielded. See datestuff.ticker.Ticker.
+        """
+        from .ticker import Ticker
+
+        return Ticker(self, clock=clock, sleep=sleep)
+
+    def to_numpy(self):
+        """
+        Materializes the range as a datetime64 array in one vectorized pass, dates
+        become datetime64[D] and datetimes become datetime64[us]. Requires numpy.
+        """
+        if self.stop is None:
+            raise TypeError("Cannot export infinite range")
+        return self._export(0, len(self))
+
+    def iter_batches(self, size):
+        """
+        Lazily yields datetime64 arrays of at most size points each. Unlike
+        to_numpy, this works with infinite ranges as well.
+        """
+        if size < 1:
+            raise ValueError("batch size must be positive")
+
+        if self._len is None:
+            return (self._export(lower, lower + size) for lower in count(0, size))
+
+        return (
+            self._export(lower, min(lower + size, self._len))
+            for lower in range(0, self._len, size)
+        )
+
+    def _export(self, lower, upper):
+        np = require_numpy("DateRange.to_numpy")
+        return self._points(np.arange(lower, upper, dtype="int64"))
+
+    def _points(self, indices):
+        "Vectorized _point, the datetime64 points at an int64 array of indices"
+        np = require_numpy("DateRange.to_numpy")
+        unit = datetime64_unit(self.start)
+
+        if self._months is None:
+            offsets = indices * self._step_us
+            start = np.datetime64(self.start, "us")
+        else:
+            # datetime64[M] counts months from 1970-01
+            months = (indices * self._months + self._first_month - 1970 * 12).astype(
+                "datetime64[M]"
+            )
+            first_days = months.astype("datetime64[D]")
+            days = ((months + 1).astype("datetime64[D]") - first_days).astype("int64")
+            if self._month_day != -1:
+                days = np.minimum(days, self._month_day)
+            offsets = (days - 1) * 86400000000 + _micros(_time_of_day(self.start))
+            start = first_days.astype("datetime64[us]")
+
+        points = start + offsets.astype("timedelta64[us]")
+        return points.astype("datetime64[{}]".format(unit))
+
+    def _key(self):
+        """
+        Identifies the points of the range, like range two DateRanges are equal when
+        they produce the same points even if their stops or steps are spelled
+        differently.
+        """
+        if self._len == 0:
+            return (0,)
+        if self._len == 1:
+            return (1, self.start)
+        if self._months is None:
+            return (self._len, self.start, self._step_us)
+
+        # every month is at most 31 days, so 31 always clamps to the last day
+        month_day = -1 if self._month_day >= 31 else self._month_day
+        return (self._len, self.start, self._months, month_day)
 
     def __eq__(self, other):
         if isinstance(other, DateRange):
-            return (
-                self.start == other.start
-                and self.stop == other.stop
-                and self.step == other.step
-            )
+            return self._key() == other._key()
         return NotImplemented
 
+    def __hash__(self):
+        return hash(self._key())
+
     def __ne__(self, other):
         if isinstance(other, DateRange):
             return not self == other
         return NotImplemented
 
     def __getitem__(self, idx_or_slice):
-        if isinstance(idx_or_slice, int):
+        if isinstance(idx_or_slice, Integral):
             return self._getidx(idx_or_slice)
         elif isinstance(idx_or_slice, slice):
             return self._getslice(idx_or_slice)
@@ -110,47 +766,50 @@ class DateRange(object):
         )  # noqa
 
     def _getidx(self, idx):
-        if not self.stop and 0 > idx:
-            raise IndexError("Cannot negative index infinite range")
+        if 0 > idx:
+            if self._len is None:
+                raise IndexError("Cannot negative index infinite range")
+            idx += self._len
 
-        if self.stop and abs(idx) > len(self) - 1:
+        if 0 > idx or (self._len is not None and idx >= self._len):
             raise IndexError("DateRange index out of range")
 
-        if idx == 0:
-            return self.start
-        elif 0 > idx:
-            idx += len(self)
-
-        return self.start + (self.step * idx)
+        return self._point(idx)
 
     def _getslice(self, slice):
         s = slice.start, slice.stop, slice.step
 
         if s == (None, None, None) or s == (None, None, 1):
-            return DateRange(start=self.start, stop=self.stop, step=self.step)
+            return self._derive(self.start, self.stop, self.step)
 
-        start, stop, step = s
+        if self._len is None:
+            start, stop, step = self._infinite_indices(*s)
+        else:
+            start, stop, step = slice.indices(self._len)
 
-        # seems redundant but we're converting None -> 0
-        start = start or 0
-        stop = stop or 0
+        if stop is None or (step > 0 and stop == self._len):
+            # keep the original stop so slicing doesn't change how the end is spelled
+            new_stop = self.stop
+        else:
+            new_stop = self._point(stop)
 
-        # use 1 here because of multiplication
-        step = step or 1
+        return self._derive(self._point(start), new_stop, self.step * step)
 
-        if not self.stop and (0 > start or 0 > stop):
-            raise IndexError("Cannot negative index infinite range")
+    @staticmethod
+    def _infinite_indices(start, stop, step):
+        if step is None:
+            step = 1
+        elif step == 0:
+            raise ValueError("slice step cannot be zero")
 
-        new_step = self.step * step
+        if (start is not None and 0 > start) or (stop is not None and 0 > stop):
+            raise IndexError("Cannot negative index infinite range")
 
-        if not start:
-            new_start = self.start
-        else:
-            new_start = self[start]
+        if step > 0:
+            return start or 0, stop, step
 
-        if not stop:
-            new_stop = self.stop
-        else:
-            new_stop = self[stop]
+        if start is None:
+            raise IndexError("Cannot reverse slice infinite range without a start")
 
-        return DateRange(start=new_start, stop=new_stop, step=new_step)
+        # -1 is one step before the start, so the new range includes the first point
+        return start, -1 if stop is None else stop, step
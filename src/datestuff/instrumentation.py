@@ -0,0 +1,188 @@
+"""
+    datestuff.instrumentation
+    ~~~~~~~~~~~~~~~~~~~~~~~~~
+    Opt in counters and timers for the hot paths of datestuff. Nothing is recorded
+    until enable is called, and until then the hot paths run their original,
+    uninstrumented code. Enabling swaps in instrumented versions of:
+
+    * RelativeDate and RelativeDateTime clock evaluation, counted and timed as
+      "relative.clock", snapshots taken by frozen_clock count as "relative.clock"
+      only when the clock is actually called
+    * attribute lookups proxied to the underlying date, counted as "relative.getattr"
+    * DateRange, ZonedDateRange and BusinessDayRange iteration and NumPy export,
+      counted as "daterange.iterations" and "daterange.exports" with the number of
+      points in "daterange.points"
+    * slow paths that fall back to per element work, counted as "slow_path.<name>"
+
+    Listeners are called with (kind, name, value) for every recorded measurement,
+    where kind is "count" or "time", which makes it simple to forward them to a
+    metrics system.
+    :copyright: 2016, Alec Reiter
+    :license: MIT, see LICENSE for more details
+"""
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+__all__ = ["Registry", "enable", "disable", "instrumented", "active", "slow_path"]
+
+_active = None
+_originals = {}
+
+
+class Registry(object):
+    "Collects counters and timers and forwards them to listeners"
+
+    def __init__(self):
+        self.counters = defaultdict(int)
+        self.timers = defaultdict(float)
+        self._listeners = []
+
+    def subscribe(self, listener):
+        "Calls listener(kind, name, value) for every measurement"
+        self._listeners.append(listener)
+        return listener
+
+    def unsubscribe(self, listener):
+        self._listeners.remove(listener)
+
+    def count(self, name, value=1):
+        self.counters[name] += value
+        for listener in self._listeners:
+            listener("count", name, value)
+
+    def time(self, name, seconds):
+        self.timers[name] += seconds
+        for listener in self._listeners:
+            listener("time", name, seconds)
+
+    def snapshot(self):
+        return {"counters": dict(self.counters), "timers": dict(self.timers)}
+
+    def reset(self):
+        self.counters.clear()
+        self.timers.clear()
+
+
+def active():
+    "The registry currently recording or None when instrumentation is disabled"
+    return _active
+
+
+def slow_path(name):
+    "Records that a slow path was taken, cheap enough to call from slow paths only"
+    if _active is not None:
+        _active.count("slow_path." + name)
+
+
+def _timed_now(original):
+    def _now(self):
+        from .relative import _SNAPSHOTS
+
+        snapshot = _SNAPSHOTS.get()
+        try:
+            cached = snapshot is not None and self._clock in snapshot
+        except TypeError:  # unhashable clocks are never cached
+            cached = False
+
+        if cached:
+            return original(self)
+
+        started = time.perf_counter()
+        try:
+            return original(self)
+        finally:
+            _active.count("relative.clock")
+            _active.time("relative.clock", time.perf_counter() - started)
+
+    return property(_now)
+
+
+def _counted_getattr(original):
+    def __getattr__(self, attr):
+        _active.count("relative.getattr")
+        return original(self, attr)
+
+    return __getattr__
+
+
+def _counted_iter(original):
+    def __iter__(self):
+        produced = 0
+        try:
+            for point in original(self):
+                produced += 1
+                yield point
+        finally:
+            _active.count("daterange.iterations")
+            _active.count("daterange.points", produced)
+
+    return __iter__
+
+
+def _counted_export(original):
+    def _export(self, lower, upper):
+        _active.count("daterange.exports")
+        _active.count("daterange.points", max(upper - lower, 0))
+        return original(self, lower, upper)
+
+    return _export
+
+
+def _patches():
+    from .busday import BusinessDayRange
+    from .daterange import DateRange
+    from .relative import _RelativeBase
+    from .zoned import ZonedDateRange
+
+    return [
+        (_RelativeBase, "_now", lambda original: _timed_now(original.fget)),
+        (_RelativeBase, "__getattr__", _counted_getattr),
+        (DateRange, "__iter__", _counted_iter),
+        (DateRange, "_export", _counted_export),
+        # subclasses that iterate by index don't go through DateRange.__iter__
+        (ZonedDateRange, "__iter__", _counted_iter),
+        (BusinessDayRange, "__iter__", _counted_iter),
+    ]
+
+
+def enable(registry=None):
+    """
+    Starts recording into registry, a new Registry by default, and returns it.
+    Calling enable again switches to the new registry.
+    """
+    global _active
+
+    if not _originals:
+        for owner, name, wrap in _patches():
+            original = owner.__dict__[name]
+            _originals[owner, name] = original
+            setattr(owner, name, wrap(original))
+
+    _active = registry if registry is not None else Registry()
+    return _active
+
+
+def disable():
+    "Stops recording and restores the original uninstrumented code"
+    global _active
+
+    for (owner, name), original in _originals.items():
+        setattr(owner, name, original)
+
+    _originals.clear()
+    _active = None
+
+
+@contextmanager
+def instrumented(registry=None):
+    "Records into registry for the duration of the block"
+    previous = _active
+    registry = enable(registry)
+    try:
+        yield registry
+    finally:
+        if previous is None:
+            disable()
+        else:
+            enable(previous)
@@ -0,0 +1,93 @@
+"""
+    datestuff.parallel
+    ~~~~~~~~~~~~~~~~~~
+    Spreads per point work over a DateRange across a pool of worker processes
+    :copyright: 2016, Alec Reiter
+    :license: MIT, see LICENSE for more details
+"""
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+__all__ = ["map_range"]
+
+
+def _map_chunk(func, date_range, lower, upper):
+    return [func(when) for when in date_range[lower:upper]]
+
+
+def _fill_chunk(func, date_range, lower, upper, name, typecode):
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = SharedMemory(name=name)
+    try:
+        # the view must be released before close even when func raises
+        with shm.buf.cast(typecode) as results:
+            for idx, when in enumerate(date_range[lower:upper], lower):
+                results[idx] = func(when)
+    finally:
+        shm.close()
+
+
+def map_range(func, date_range, executor=None, chunksize=1024, typecode=None):
+    """
+    Applies func to every point of a finite DateRange using executor, which defaults
+    to a ProcessPoolExecutor that is shut down afterwards. Workers only receive the
+    range and the index bounds of their chunk and build the points themselves.
+
+    Without a typecode the results are returned as a list in range order. With an
+    array module typecode (such as "d" or "q") func must return numbers, which workers
+    write directly into a shared memory buffer indexed by range position instead of
+    pickling them back, and an array.array is returned.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive")
+
+    total = len(date_range)
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ProcessPoolExecutor()
+
+    try:
+        if typecode is None:
+            futures = [
+                executor.submit(_map_chunk, func, date_range, lower, lower + chunksize)
+                for lower in range(0, total, chunksize)
+            ]
+            results = []
+            for future in futures:
+                results.extend(future.result())
+            return results
+
+        return _map_shared(func, date_range, executor, chunksize, typecode, total)
+    finally:
+        if owns_executor:
+            executor.shutdown()
+
+
+def _map_shared(func, date_range, executor, chunksize, typecode, total):
+    from multiprocessing.shared_memory import SharedMemory
+
+    results = array(typecode)
+    shm = SharedMemory(create=True, size=max(total * results.itemsize, 1))
+
+    try:
+        futures = [
+            executor.submit(
+                _fill_chunk,
+                func,
+                date_range,
+                lower,
+                lower + chunksize,
+                shm.name,
+                typecode,
+            )
+            for lower in range(0, total, chunksize)
+        ]
+        for future in futures:
+            future.result()
+
+        results.frombytes(bytes(shm.buf[: total * results.itemsize]))
+        return results
+    finally:
+        shm.close()
+        shm.unlink()
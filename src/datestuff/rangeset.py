@@ -0,0 +1,175 @@
+"""
+    datestuff.rangeset
+    ~~~~~~~~~~~~~~~~~~
+    Answers which of many DateRanges cover a moment without checking each one
+    :copyright: 2016, Alec Reiter
+    :license: MIT, see LICENSE for more details
+"""
+from bisect import bisect_right
+from collections import namedtuple
+
+__all__ = ["RangeSet", "Span"]
+
+
+Span = namedtuple("Span", ["low", "high", "range"])
+Span.__doc__ = """
+The half open interval [low, high) covered by a range, None stands for unbounded.
+"""
+
+
+def _span(date_range):
+    """
+    Span covered by the ascending buckets of a range's points, None for an empty
+    range
+    """
+    size = date_range._len
+
+    if size == 0:
+        return None
+    if date_range._forward:
+        high = None if size is None else date_range._point(size)
+        return Span(date_range._point(0), high, date_range)
+
+    low = None if size is None else date_range._point(size - 1)
+    return Span(low, date_range._point(-1), date_range)
+
+
+def _starts_by(when, span):
+    return span.low is None or span.low <= when
+
+
+def _ends_after(when, span):
+    return span.high is None or when < span.high
+
+
+def _by_low(span):
+    return span.low is not None, span.low
+
+
+def _by_high(span):
+    return span.high is None, span.high
+
+
+class _Node(object):
+    """
+    Centered interval tree node. Holds the spans that start at or before its center
+    and end at or after it, sorted both ways, and the spans entirely to either side
+    in its children.
+    """
+
+    __slots__ = ("center", "by_low", "by_high", "left", "right")
+
+    def __init__(self, spans):
+        ends = sorted(
+            end for span in spans for end in (span.low, span.high) if end is not None
+        )
+        # spans touching the center stay here, so every node keeps at least one
+        center = ends[len(ends) // 2]
+        left, right, here = [], [], []
+
+        for span in spans:
+            if span.high is not None and span.high < center:
+                left.append(span)
+            elif span.low is not None and center < span.low:
+                right.append(span)
+            else:
+                here.append(span)
+
+        self.center = center
+        self.by_low = sorted(here, key=_by_low)
+        self.by_high = sorted(here, key=_by_high, reverse=True)
+        self.left = _Node(left) if left else None
+        self.right = _Node(right) if right else None
+
+    def stab(self, when, found):
+        node = self
+        while node is not None:
+            if when < node.center:
+                # every span here ends after the center, so only the start matters
+                for span in node.by_low:
+                    if not _starts_by(when, span):
+                        break
+                    found.append(span)
+                node = node.left
+            else:
+                for span in node.by_high:
+                    if not _ends_after(when, span):
+                        break
+                    found.append(span)
+                node = node.right
+        return found
+
+
+class RangeSet(object):
+    """
+    An immutable collection of DateRanges, each treated as the span it covers: the
+    buckets from each of its points up to the next one (see DateRange.bucket_of), so
+    a daily range from Monday up to Friday covers all of Monday through Thursday. A
+    descending range covers the buckets of the same points taken in ascending order,
+    so a range from 10:00 down to 06:00 by the hour covers 07:00 up to 11:00 even
+    though its own bucket_of counts each point's bucket backwards from it.
+
+    Overlapping and touching spans are merged into a sorted list of disjoint spans,
+    so membership and next_covered bisect the list, and the original spans are kept
+    in a centered interval tree to find the ranges covering a moment. Every query is
+    O(log n) plus the number of ranges it returns.
+    """
+
+    __slots__ = ("_spans", "_lows", "_highs", "_tree")
+
+    def __init__(self, ranges=()):
+        spans = [span for span in map(_span, ranges) if span is not None]
+        lows, highs = [], []
+
+        for span in sorted(spans, key=_by_low):
+            if not highs or (highs[-1] is not None and not _starts_by(highs[-1], span)):
+                lows.append(span.low)
+                highs.append(span.high)
+            elif highs[-1] is not None:
+                highs[-1] = None if span.high is None else max(highs[-1], span.high)
+
+        self._spans = spans
+        self._lows = lows
+        self._highs = highs
+        self._tree = _Node(spans) if spans else None
+
+    def __repr__(self):
+        return "{!s}({!r})".format(
+            self.__class__.__name__, [span.range for span in self._spans]
+        )
+
+    def __len__(self):
+        return len(self._spans)
+
+    def __iter__(self):
+        return (span.range for span in self._spans)
+
+    def _merged(self, when):
+        "Index of the merged span starting at or before when, -1 if there is none"
+        lowest = 1 if self._lows and self._lows[0] is None else 0
+        return bisect_right(self._lows, when, lowest) - 1
+
+    def __contains__(self, when):
+        idx = self._merged(when)
+        return idx >= 0 and (self._highs[idx] is None or when < self._highs[idx])
+
+    def spans(self):
+        "The merged, disjoint spans as (low, high) pairs in order"
+        return list(zip(self._lows, self._highs))
+
+    def covering(self, when):
+        "The ranges whose spans contain when, in no particular order"
+        if self._tree is None:
+            return []
+        return [span.range for span in self._tree.stab(when, [])]
+
+    def next_covered(self, when):
+        """
+        The earliest moment at or after when that is covered by a range, or None if
+        nothing is covered from when on.
+        """
+        if when in self:
+            return when
+
+        idx = self._merged(when) + 1
+        return self._lows[idx] if idx < len(self._lows) else None
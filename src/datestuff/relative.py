@@ -1,12 +1,27 @@
+import sys
+import threading
 from abc import abstractmethod
+from contextlib import contextmanager
 from datetime import date, datetime, time, timedelta
 
 from ._comparable import ComparableMixin
 
 try:
-    from dateutil.relativedelta import relativedelta
+    from contextvars import ContextVar
 except ImportError:  # pragma: no cover
-    relativedelta = timedelta
+    ContextVar = None
+
+
+def _is_delta(value):
+    """
+    Checks for timedelta or dateutil's relativedelta without importing dateutil, if
+    it hasn't been imported yet then value can't be a relativedelta.
+    """
+    if isinstance(value, timedelta):
+        return True
+
+    module = sys.modules.get("dateutil.relativedelta")
+    return module is not None and isinstance(value, module.relativedelta)
 
 
 ZERO = timedelta(0)
@@ -15,14 +30,67 @@ NOW_DT = lambda: datetime.now()  # noqa
 UTCNOW_DT = lambda: datetime.utcnow()  # noqa
 
 
+class _ThreadLocalVar(threading.local):
+    "Stand in for ContextVar where contextvars isn't available"
+    value = None
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        previous, self.value = self.value, value
+        return previous
+
+    def reset(self, previous):
+        self.value = previous
+
+
+if ContextVar is not None:
+    _SNAPSHOTS = ContextVar("datestuff_clock_snapshots", default=None)
+else:  # pragma: no cover
+    _SNAPSHOTS = _ThreadLocalVar()
+
+
+@contextmanager
+def frozen_clock():
+    """
+    Within this context every relative instance calls its clock at most once and
+    reuses the result, so repeated comparisons, formatting and attribute access see
+    the same moment. Snapshots are per context so they are safe to use from threads
+    and asyncio tasks. Nested uses share the outermost snapshot.
+    """
+    if _SNAPSHOTS.get() is not None:
+        yield
+        return
+
+    token = _SNAPSHOTS.set({})
+    try:
+        yield
+    finally:
+        _SNAPSHOTS.reset(token)
+
+
 class _RelativeBase(ComparableMixin):
+    __slots__ = ()
+
     @abstractmethod
     def replace(self, **kwargs):
         pass
 
     @property
     def _now(self):
-        return self._clock() + self.offset
+        snapshot = _SNAPSHOTS.get()
+        if snapshot is None:
+            return self._clock() + self.offset
+
+        clock = self._clock
+        try:
+            now = snapshot[clock]
+        except KeyError:
+            now = snapshot[clock] = clock()
+        except TypeError:  # unhashable clocks can't be cached
+            now = clock()
+        return now + self.offset
 
     @classmethod
     def today(cls, offset=ZERO):
@@ -51,7 +119,7 @@ class _RelativeBase(ComparableMixin):
         if isinstance(other, RelativeDate):
             new_offset = self.offset + other.offset
             return self.__class__(new_offset, self._clock)
-        elif isinstance(other, (timedelta, relativedelta)):
+        elif _is_delta(other):
             return self.__class__(self.offset + other, self._clock)
         return self._now + other
 
@@ -67,7 +135,7 @@ class _RelativeBase(ComparableMixin):
         are possible, then it subtracts the other object from the underlying date and returns that
         result.
         """
-        if isinstance(other, (timedelta, relativedelta)):
+        if _is_delta(other):
             return self.__class__(self.offset - other, self._clock)
         elif isinstance(other, RelativeDate):
             new_offset = self.offset - other.offset
@@ -101,6 +169,8 @@ class RelativeDate(_RelativeBase):
     An unfixed date that is comparable to regular date and datetime objects.
     """
 
+    __slots__ = ("offset", "_clock")
+
     def __init__(self, offset=ZERO, clock=TODAY_DATE):
         self.offset = offset
         self._clock = clock
@@ -124,6 +194,8 @@ class RelativeDateTime(_RelativeBase):
     to make it an appropriate replacement for a datetime object.
     """
 
+    __slots__ = ("offset", "_clock")
+
     def __init__(self, offset=ZERO, clock=NOW_DT):
         self.offset = offset
         self._clock = clock
@@ -168,3 +240,10 @@ class RelativeDateTime(_RelativeBase):
     def fromdate(when, tzinfo=None, offset=ZERO):
         clock = lambda: datetime.combine(when, time(tzinfo=tzinfo))  # noqa
         return RelativeDateTime(offset=offset, clock=clock)
+
+
+def _resolve(value):
+    "The current value of a relative instance, anything else is returned as is"
+    if isinstance(value, _RelativeBase):
+        return value._now
+    return value
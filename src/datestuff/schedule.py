@@ -0,0 +1,84 @@
+"""
+    datestuff.schedule
+    ~~~~~~~~~~~~~~~~~~
+    Combines many DateRanges into a single stream of occurrences
+    :copyright: 2016, Alec Reiter
+    :license: MIT, see LICENSE for more details
+"""
+from heapq import heapify, heappop, heapreplace
+
+__all__ = ["Schedule"]
+
+_MISSING = object()
+
+
+class Schedule(object):
+    """
+    The union of the points of several ascending DateRanges, like a set of cron
+    entries. Iterating merges the ranges lazily with a heap and yields points shared
+    by several ranges once. next_after and prev_before ask each range for its
+    neighbouring point with index arithmetic, so a query is O(k) for k ranges no
+    matter how far into the ranges it is.
+    """
+
+    __slots__ = ("ranges",)
+
+    def __init__(self, ranges=()):
+        ranges = tuple(ranges)
+        if any(not dr._forward for dr in ranges):
+            raise ValueError("Schedule requires ranges with a positive step")
+        self.ranges = ranges
+
+    def __repr__(self):
+        return "{!s}({!r})".format(self.__class__.__name__, list(self.ranges))
+
+    def __contains__(self, when):
+        return any(when in dr for dr in self.ranges)
+
+    def __iter__(self):
+        return self._merge(self.ranges)
+
+    def iter_from(self, when):
+        "Lazily yields the merged points at or after when"
+        return self._merge(dr[dr.searchsorted(when):] for dr in self.ranges)
+
+    @staticmethod
+    def _merge(ranges):
+        heap = []
+        for order, dr in enumerate(ranges):
+            points = iter(dr)
+            first = next(points, _MISSING)
+            if first is not _MISSING:
+                heap.append((first, order, points))
+        heapify(heap)
+
+        last = _MISSING
+        while heap:
+            point, order, points = heap[0]
+            if last is _MISSING or point != last:
+                yield point
+                last = point
+
+            following = next(points, _MISSING)
+            if following is _MISSING:
+                heappop(heap)
+            else:
+                heapreplace(heap, (following, order, points))
+
+    def next_after(self, when):
+        "The earliest point strictly after when or None if there are no more points"
+        candidates = []
+        for dr in self.ranges:
+            idx = dr.searchsorted(when, side="right")
+            if dr._len is None or idx < dr._len:
+                candidates.append(dr[idx])
+        return min(candidates) if candidates else None
+
+    def prev_before(self, when):
+        "The latest point strictly before when or None if there are no earlier points"
+        candidates = []
+        for dr in self.ranges:
+            idx = dr.searchsorted(when, side="left")
+            if idx:
+                candidates.append(dr[idx - 1])
+        return max(candidates) if candidates else None
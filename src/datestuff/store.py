@@ -0,0 +1,205 @@
+"""
+    datestuff.store
+    ~~~~~~~~~~~~~~~
+    Compact binary file of many DateRanges that is memory mapped and read lazily
+    :copyright: 2016, Alec Reiter
+    :license: MIT, see LICENSE for more details
+"""
+import mmap
+import struct
+from datetime import datetime, timedelta
+
+from .daterange import DateRange, _micros
+
+__all__ = ["Store", "write_store"]
+
+_MAGIC = b"DSTSTORE"
+_VERSION = 1
+
+# magic, version, number of ranges, number of exceptions
+_HEADER = struct.Struct("<8sIIQ")
+_ID = struct.Struct("<Q")
+# start, stop, step, first exception, number of exceptions, flags
+_RECORD = struct.Struct("<qqqQIB3x")
+_EXCEPTION = struct.Struct("<q")
+
+_IS_DATE = 1
+_HAS_STOP = 2
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_micros(when):
+    if isinstance(when, datetime):
+        if when.tzinfo is not None:
+            raise ValueError("timezone aware values cannot be stored")
+        return _micros(when - _EPOCH)
+    return _micros(when - _EPOCH.date())
+
+
+def _from_micros(value, is_date):
+    if is_date:
+        return _EPOCH.date() + timedelta(days=value // 86400000000)
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _bisect(read, low, high, target):
+    "bisect_left over the values read(low) to read(high - 1)"
+    while low < high:
+        middle = (low + high) // 2
+        if read(middle) < target:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def write_store(path, ranges, exceptions=None):
+    """
+    Writes a mapping of integer ids to DateRanges to path. exceptions optionally
+    maps ids to dates or datetimes to exclude from that range, such as holidays.
+
+    The file starts with a header followed by the sorted ids, one fixed size record
+    per range holding its start, stop and step as integer microseconds and finally
+    every range's sorted exceptions. Only ranges of naive dates or datetimes with a
+    fixed length step can be stored.
+    """
+    exceptions = exceptions or {}
+    ids = sorted(ranges)
+    records, excluded = [], []
+
+    for key in ids:
+        date_range = ranges[key]
+        date_range._fixed_step("storing a DateRange")
+        flags = _HAS_STOP if date_range.stop is not None else 0
+        if not isinstance(date_range.start, datetime):
+            flags |= _IS_DATE
+
+        points = sorted({_to_micros(when) for when in exceptions.get(key, ())})
+        records.append(
+            _RECORD.pack(
+                _to_micros(date_range.start),
+                0 if date_range.stop is None else _to_micros(date_range.stop),
+                date_range._step_us,
+                len(excluded),
+                len(points),
+                flags,
+            )
+        )
+        excluded.extend(points)
+
+    with open(path, "wb") as fh:
+        fh.write(_HEADER.pack(_MAGIC, _VERSION, len(ids), len(excluded)))
+        fh.writelines(_ID.pack(key) for key in ids)
+        fh.writelines(records)
+        fh.writelines(_EXCEPTION.pack(point) for point in excluded)
+
+
+class Store(object):
+    """
+    Read only view of a file written by write_store. The file is memory mapped, so
+    processes opening the same file share a single copy through the page cache, and
+    nothing is decoded up front: ids are found by bisecting the sorted id table and
+    only the requested record is turned into a DateRange.
+    """
+
+    __slots__ = ("_file", "_map", "_count", "_records", "_exceptions")
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+
+        size = len(self._map)
+        header = _HEADER.unpack_from(self._map, 0) if size >= _HEADER.size else None
+        if header is None or header[:2] != (_MAGIC, _VERSION):
+            self.close()
+            raise ValueError("{!r} is not a DateRange store".format(path))
+
+        count, excluded = header[2:]
+        self._count = count
+        self._records = _HEADER.size + count * _ID.size
+        self._exceptions = self._records + count * _RECORD.size
+
+        if size < self._exceptions + excluded * _EXCEPTION.size:
+            self.close()
+            raise ValueError("{!r} is truncated".format(path))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __iter__(self):
+        for idx in range(self._count):
+            yield self._id(idx)
+
+    def __getitem__(self, key):
+        start, stop, step, is_date, has_stop = self._record(key)[:5]
+        return DateRange(
+            _from_micros(start, is_date),
+            _from_micros(stop, is_date) if has_stop else None,
+            timedelta(microseconds=step),
+        )
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def _id(self, idx):
+        return _ID.unpack_from(self._map, _HEADER.size + idx * _ID.size)[0]
+
+    def _find(self, key):
+        idx = _bisect(self._id, 0, self._count, key)
+        if idx < self._count and self._id(idx) == key:
+            return idx
+        return None
+
+    def _record(self, key):
+        idx = self._find(key)
+        if idx is None:
+            raise KeyError(key)
+
+        start, stop, step, first, count, flags = _RECORD.unpack_from(
+            self._map, self._records + idx * _RECORD.size
+        )
+        return start, stop, step, flags & _IS_DATE, flags & _HAS_STOP, first, count
+
+    def _exception(self, idx):
+        offset = self._exceptions + idx * _EXCEPTION.size
+        return _EXCEPTION.unpack_from(self._map, offset)[0]
+
+    def exceptions(self, key):
+        "The sorted exceptions stored for a range"
+        is_date, _, first, count = self._record(key)[3:]
+        return [
+            _from_micros(self._exception(idx), is_date)
+            for idx in range(first, first + count)
+        ]
+
+    def is_exception(self, key, when):
+        "Checks if when is one of the exceptions of a range by bisecting them"
+        first, count = self._record(key)[5:]
+        target = _to_micros(when)
+        idx = _bisect(self._exception, first, first + count, target)
+        return idx < first + count and self._exception(idx) == target
+
+    def contains(self, key, when):
+        "Checks if when is a point of a range and not one of its exceptions"
+        return when in self[key] and not self.is_exception(key, when)
@@ -0,0 +1,178 @@
+"""
+    datestuff.ticker
+    ~~~~~~~~~~~~~~~~
+    Drives periodic work from DateRanges on an asyncio event loop
+    :copyright: 2016, Alec Reiter
+    :license: MIT, see LICENSE for more details
+"""
+import asyncio
+import heapq
+from datetime import date, datetime
+from itertools import count
+
+__all__ = ["Ticker", "TickScheduler"]
+
+
+def _default_clock(when):
+    if isinstance(when, datetime):
+        return lambda: datetime.now(when.tzinfo)
+    return date.today
+
+
+def _check_forward(date_range):
+    if not date_range._forward:
+        raise ValueError("cannot tick through a range with a negative step")
+
+
+def _latest_due(date_range, now):
+    "Index of the last point at or before now, -1 if none are due yet"
+    return date_range.searchsorted(now, side="right") - 1
+
+
+def _exhausted(date_range, idx):
+    return date_range._len is not None and idx >= date_range._len
+
+
+class Ticker(object):
+    """
+    Asynchronous iterator over the points of a DateRange that waits until each point
+    is reached before yielding it. When several points were missed only the most
+    recent one is yielded, found with the range's index arithmetic.
+
+    clock returns the current date or datetime and defaults to date.today or
+    datetime.now matching the range. sleep is awaited with a number of seconds and
+    defaults to asyncio.sleep.
+    """
+
+    def __init__(self, date_range, clock=None, sleep=None):
+        _check_forward(date_range)
+        self._range = date_range
+        self._clock = clock or _default_clock(date_range.start)
+        self._sleep = sleep or asyncio.sleep
+        self._next = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            now = self._clock()
+            latest = _latest_due(self._range, now)
+
+            if latest >= self._next:
+                self._next = latest + 1
+                return self._range[latest]
+
+            if _exhausted(self._range, self._next):
+                raise StopAsyncIteration
+
+            await self._sleep((self._range[self._next] - now).total_seconds())
+
+
+class _Entry(object):
+    def __init__(self, date_range, callback):
+        self.date_range = date_range
+        self.callback = callback
+        self.next = 0
+        self.cancelled = False
+
+    def cancel(self):
+        "Stops the schedule from firing again"
+        self.cancelled = True
+
+
+class TickScheduler(object):
+    """
+    Multiplexes many DateRange schedules on a single event loop. Schedules are kept
+    in a heap ordered by their next fire time so only the earliest one is waited on.
+    Like Ticker, missed points are skipped and the callback receives only the most
+    recent overdue point. Callbacks returning awaitables are run as tasks.
+
+    clock defaults to datetime.now, so without a clock every range has to be a
+    range of naive datetimes. sleep is awaited with a number of seconds and defaults
+    to asyncio.sleep, adding a schedule cuts the current sleep short.
+    """
+
+    def __init__(self, clock=None, sleep=None):
+        self._default_clock = clock is None
+        self._clock = clock or datetime.now
+        self._sleep = sleep or asyncio.sleep
+        self._heap = []
+        self._counter = count()
+        self._wakeup = None
+
+    def __len__(self):
+        return sum(1 for _, _, entry in self._heap if not entry.cancelled)
+
+    def add(self, date_range, callback):
+        """
+        Registers callback to be called with each point of date_range. Returns a
+        handle whose cancel method unregisters it.
+        """
+        _check_forward(date_range)
+        start = date_range.start
+        if self._default_clock and (
+            not isinstance(start, datetime) or start.tzinfo is not None
+        ):
+            raise TypeError(
+                "a clock must be given to schedule ranges of anything other than "
+                "naive datetimes"
+            )
+
+        entry = _Entry(date_range, callback)
+        self._push(entry)
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return entry
+
+    def _push(self, entry):
+        if not _exhausted(entry.date_range, entry.next):
+            fire_at = entry.date_range[entry.next]
+            heapq.heappush(self._heap, (fire_at, next(self._counter), entry))
+
+    async def _pause(self, seconds):
+        "Sleeps for seconds or until add wakes the loop up, whichever is first"
+        sleeping = asyncio.ensure_future(self._sleep(seconds))
+        waking = asyncio.ensure_future(self._wakeup.wait())
+        try:
+            await asyncio.wait([sleeping, waking], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            sleeping.cancel()
+            waking.cancel()
+        self._wakeup.clear()
+
+    async def run(self):
+        "Runs until every schedule is exhausted or cancelled"
+        self._wakeup = asyncio.Event()
+        tasks = set()
+
+        try:
+            while self._heap:
+                fire_at, _, entry = self._heap[0]
+
+                if entry.cancelled:
+                    heapq.heappop(self._heap)
+                    continue
+
+                now = self._clock()
+                if fire_at > now:
+                    await self._pause((fire_at - now).total_seconds())
+                    continue
+
+                heapq.heappop(self._heap)
+                latest = _latest_due(entry.date_range, now)
+                entry.next = latest + 1
+                result = entry.callback(entry.date_range[latest])
+
+                if asyncio.iscoroutine(result) or isinstance(result, asyncio.Future):
+                    task = asyncio.ensure_future(result)
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+
+                self._push(entry)
+
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            self._wakeup = None
@@ -1,3 +1,14 @@
+from collections import deque
+
+from ._numpy import require_numpy
+
+_MISSING = object()
+
+
+def _identity(value):
+    return value
+
+
 def within_delta(dt1, dt2, delta):
     """
     Useful for comparing two datetimes that may a negilible difference
@@ -5,3 +16,94 @@ def within_delta(dt1, dt2, delta):
     """
     difference = dt1 - dt2
     return -delta <= difference <= delta
+
+
+def tolerance_join(left, right, delta, key=None):
+    """
+    Pairs up items from two iterables that are sorted by time whose keys are
+    within_delta of one another. Both iterables are consumed in a single pass and only
+    the right items that can still match are buffered, so memory is bounded by how
+    many right items fall within a window of twice the delta. key extracts the
+    timestamp from an item and defaults to the item itself.
+    """
+    key = key or _identity
+    right = iter(right)
+    window = deque()
+    pending = next(right, _MISSING)
+
+    for item in left:
+        when = key(item)
+        earliest, latest = when - delta, when + delta
+
+        while window and window[0][0] < earliest:
+            window.popleft()
+
+        while pending is not _MISSING:
+            pending_when = key(pending)
+            if pending_when > latest:
+                break
+            if pending_when >= earliest:
+                window.append((pending_when, pending))
+            pending = next(right, _MISSING)
+
+        for _, match in window:
+            yield item, match
+
+
+def asof_join(left, right, tolerance=None, key=None):
+    """
+    Pairs each item from left with the latest item from right at or before it, both
+    iterables must be sorted by time. The right item is None when there isn't one or
+    when it is more than tolerance older than the left item. Runs in a single pass.
+    """
+    key = key or _identity
+    right = iter(right)
+    last = last_when = None
+    pending = next(right, _MISSING)
+
+    for item in left:
+        when = key(item)
+
+        while pending is not _MISSING and key(pending) <= when:
+            last, last_when = pending, key(pending)
+            pending = next(right, _MISSING)
+
+        if last_when is None or (
+            tolerance is not None and when - last_when > tolerance
+        ):
+            yield item, None
+        else:
+            yield item, last
+
+
+def tolerance_join_indices(left, right, delta):
+    """
+    NumPy version of tolerance_join for sorted datetime64 arrays. Returns a pair of
+    index arrays, left[i] and right[j] are within delta for each (i, j) pair.
+    """
+    np = require_numpy("tolerance_join_indices")
+    left, right, delta = np.asarray(left), np.asarray(right), np.timedelta64(delta)
+
+    lower = np.searchsorted(right, left - delta, side="left")
+    counts = np.searchsorted(right, left + delta, side="right") - lower
+    counts = np.maximum(counts, 0)
+
+    left_idx = np.repeat(np.arange(len(left)), counts)
+    # position of each pair within its left item's run of matches
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return left_idx, np.repeat(lower, counts) + offsets
+
+
+def asof_join_indices(left, right, tolerance=None):
+    """
+    NumPy version of asof_join for sorted datetime64 arrays. Returns the index into
+    right for each item of left, or -1 where there is no match.
+    """
+    np = require_numpy("asof_join_indices")
+    left, right = np.asarray(left), np.asarray(right)
+
+    idx = np.searchsorted(right, left, side="right") - 1
+    if tolerance is not None and len(right):
+        too_old = left - right[np.maximum(idx, 0)] > np.timedelta64(tolerance)
+        idx[too_old] = -1
+    return idx
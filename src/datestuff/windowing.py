@@ -0,0 +1,86 @@
+"""
+    datestuff.windowing
+    ~~~~~~~~~~~~~~~~~~~
+    Groups an unbounded stream of timestamped events into event time windows
+    :copyright: 2016, Alec Reiter
+    :license: MIT, see LICENSE for more details
+"""
+from collections import namedtuple
+from heapq import heappop, heappush
+
+__all__ = ["Window", "assign_windows", "sliding_windows", "tumbling_windows"]
+
+
+Window = namedtuple("Window", ["start", "end", "events"])
+Window.__doc__ = """
+A closed window holding the (timestamp, payload) events with start <= timestamp < end
+in the order they arrived.
+"""
+
+
+def assign_windows(events, date_range, size=1, lateness=None, on_late=None):
+    """
+    Lazily groups (timestamp, payload) pairs into windows that start at each point
+    of date_range and last size steps, so size=1 gives tumbling windows and a larger
+    size gives windows sliding by one step. The events may be slightly out of order.
+
+    The watermark is the latest timestamp seen less the allowed lateness. A window
+    is closed and yielded once the watermark reaches its end, windows without any
+    events are skipped. Events that only belong to windows that were already closed
+    are passed to on_late(timestamp, payload), or dropped if it isn't provided, and
+    events outside of date_range are ignored. When events runs out the remaining
+    windows are yielded. Only open windows are held in memory.
+    """
+    if size < 1:
+        raise ValueError("window size must be positive")
+    if not date_range._forward:
+        raise ValueError("windows require a range with a positive step")
+
+    last_index = None if date_range._len is None else date_range._len - 1
+    open_windows, starts = {}, []
+    # index of the first window that hasn't been closed yet
+    closed = 0
+    latest = None
+
+    for timestamp, payload in events:
+        bucket = date_range._floor_index(timestamp)
+        lowest = max(bucket - size + 1, 0)
+        highest = bucket if last_index is None else min(bucket, last_index)
+
+        if highest < closed:
+            if lowest <= highest and on_late is not None:
+                on_late(timestamp, payload)
+        else:
+            for idx in range(max(lowest, closed), highest + 1):
+                if idx not in open_windows:
+                    open_windows[idx] = []
+                    heappush(starts, idx)
+                open_windows[idx].append((timestamp, payload))
+
+        if latest is None or latest < timestamp:
+            latest = timestamp
+            watermark = latest if lateness is None else latest - lateness
+            # the window starting at idx ends at the point size steps later
+            closed = max(closed, date_range._floor_index(watermark) - size + 1)
+
+        while starts and starts[0] < closed:
+            yield _close(date_range, size, heappop(starts), open_windows)
+
+    while starts:
+        yield _close(date_range, size, heappop(starts), open_windows)
+
+
+def _close(date_range, size, idx, open_windows):
+    return Window(
+        date_range._point(idx), date_range._point(idx + size), open_windows.pop(idx)
+    )
+
+
+def tumbling_windows(events, date_range, lateness=None, on_late=None):
+    "Windows one step of date_range long, see assign_windows"
+    return assign_windows(events, date_range, 1, lateness, on_late)
+
+
+def sliding_windows(events, date_range, size, lateness=None, on_late=None):
+    "Windows size steps of date_range long starting at every point, see assign_windows"
+    return assign_windows(events, date_range, size, lateness, on_late)
@@ -0,0 +1,455 @@
+"""
+    datestuff.zoned
+    ~~~~~~~~~~~~~~~
+    Timezone aware DateRange that stays correct across DST transitions
+    :copyright: 2016, Alec Reiter
+    :license: MIT, see LICENSE for more details
+"""
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from itertools import count, islice
+
+from .daterange import DateRange, _micros, _set
+from ._numpy import require_numpy
+
+__all__ = ["ZonedDateRange"]
+
+WALL = "wall"
+ABSOLUTE = "absolute"
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = 1000000
+# no zone changes its offset twice within a day, so daily probes find every change
+_DAY = 86400 * _SECOND
+_TABLES = {}
+
+
+def _utc_micros(when):
+    "Microseconds since the epoch of an aware datetime, in UTC"
+    offset = when.utcoffset()
+    if offset is None:
+        raise TypeError("can't compare naive and aware datetimes")
+    return _micros(when.replace(tzinfo=None) - _EPOCH) - _micros(offset)
+
+
+def _naive(micros):
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _dropped_before(drops, idx):
+    "How many of the dropped (first, end) grid index intervals come before idx"
+    return sum(min(max(idx - first, 0), end - first) for first, end in drops)
+
+
+class _Transitions(object):
+    """
+    The UTC offset changes of a tzinfo, found a calendar year at a time by probing
+    the offset daily and bisecting to the second it changed. Lookups bisect the
+    table rather than asking the tzinfo.
+    """
+
+    def __init__(self, tz):
+        self._tz = tz
+        self._years = {}
+
+    @classmethod
+    def of(cls, tz):
+        "Tables are shared by every range using the same tzinfo"
+        try:
+            return _TABLES[tz]
+        except KeyError:
+            table = _TABLES[tz] = cls(tz)
+            return table
+
+    def _query(self, utc):
+        when = _naive(utc).replace(tzinfo=self._tz)
+        return _micros(self._tz.fromutc(when).utcoffset())
+
+    def _year(self, year):
+        try:
+            return self._years[year]
+        except KeyError:
+            pass
+
+        probe = _micros(datetime(year, 1, 1) - _EPOCH)
+        end = _micros(datetime(year + 1, 1, 1) - _EPOCH)
+        times, offsets = [probe], [self._query(probe)]
+
+        while probe < end:
+            following = min(probe + _DAY, end)
+            offset = self._query(following)
+
+            if offset != offsets[-1]:
+                # the change happened on a whole second in (low, high]
+                low, high = probe // _SECOND, following // _SECOND
+                while high - low > 1:
+                    middle = (low + high) // 2
+                    if self._query(middle * _SECOND) == offsets[-1]:
+                        low = middle
+                    else:
+                        high = middle
+                times.append(high * _SECOND)
+                offsets.append(offset)
+
+            probe = following
+
+        self._years[year] = times, offsets
+        return times, offsets
+
+    def offset_at(self, utc):
+        "UTC offset in microseconds in effect at a UTC instant"
+        times, offsets = self._year(_naive(utc).year)
+        return offsets[bisect_right(times, utc) - 1]
+
+    def to_utc(self, wall):
+        """
+        Resolves a wall clock time to a UTC instant. Ambiguous times resolve to their
+        first occurrence and times skipped by a transition move forward by the size
+        of the gap.
+        """
+        before, after = self.offset_at(wall - _DAY), self.offset_at(wall + _DAY)
+        candidates = [
+            wall - offset
+            for offset in (before, after)
+            if self.offset_at(wall - offset) == offset
+        ]
+        return min(candidates) if candidates else wall - before
+
+    def gaps(self, low, high):
+        """
+        The (start, size) in wall clock microseconds of the gaps left by transitions
+        moving the clock forward, for the years around two wall clock times
+        """
+        for year in range(_naive(low - _DAY).year, _naive(high + _DAY).year + 1):
+            times, offsets = self._year(year)
+            for idx in range(1, len(times)):
+                size = offsets[idx] - offsets[idx - 1]
+                if size > 0:
+                    yield times[idx] + offsets[idx - 1], size
+
+    def arrays(self, first_year, last_year):
+        "The transitions between two years as NumPy arrays for vectorized lookups"
+        np = require_numpy("ZonedDateRange.to_numpy")
+        times, offsets = [], []
+        for year in range(first_year, last_year + 1):
+            year_times, year_offsets = self._year(year)
+            times.extend(year_times)
+            offsets.extend(year_offsets)
+        return np.array(times, dtype="int64"), np.array(offsets, dtype="int64")
+
+
+class ZonedDateRange(DateRange):
+    """
+    A DateRange over timezone aware datetimes that handles DST transitions. The
+    step is interpreted in one of two modes:
+
+    * "wall" (the default) steps along the wall clock of start's timezone, so a
+      daily range at 09:00 stays at 09:00 across transitions. Times that fall into a
+      gap move forward by the size of the gap, or are dropped when that would take
+      them to or past the next point, so steps no longer than the gap stay in order.
+      Ambiguous times use their first occurrence. start is the wall clock anchor of
+      the range.
+    * "absolute" steps along elapsed time, so a daily range is always 24 hours apart
+      and shifts on the wall clock when the offset changes.
+
+    The zone's offset changes are computed once per year and shared between ranges,
+    length and indexing are constant time and membership and lookups bisect the
+    table instead of converting between timezones. to_numpy returns UTC instants.
+    """
+
+    __slots__ = ("mode", "_tz", "_origin", "_table")
+
+    def __init__(self, start=None, stop=None, step=None, mode=WALL):
+        if start is None or getattr(start, "tzinfo", None) is None:
+            raise TypeError("ZonedDateRange requires a timezone aware start")
+        if mode not in (WALL, ABSOLUTE):
+            raise ValueError("mode must be 'wall' or 'absolute', not {!r}".format(mode))
+        if not isinstance(step, timedelta):
+            raise TypeError("ZonedDateRange requires a timedelta step")
+
+        _set(self, "mode", mode)
+        _set(self, "_tz", start.tzinfo)
+        _set(self, "_table", _Transitions.of(start.tzinfo))
+
+        if mode == WALL:
+            _set(self, "_origin", _micros(start.replace(tzinfo=None) - _EPOCH))
+        else:
+            _set(self, "_origin", _utc_micros(start))
+
+        super(ZonedDateRange, self).__init__(start, stop, step)
+
+    def __reduce__(self):
+        return ZonedDateRange, (self.start, self.stop, self.step, self.mode)
+
+    def __repr__(self):
+        return "{!s}(start={!r}, stop={!r}, step={!r}, mode={!r})".format(
+            self.__class__.__name__, self.start, self.stop, self.step, self.mode
+        )
+
+    def __reversed__(self):
+        if self.stop:
+            return ZonedDateRange(self.stop, self.start, -self.step, self.mode)
+
+        raise ValueError("Cannot reverse infinite range")
+
+    def _derive(self, start, stop, step):
+        return ZonedDateRange(start, stop, step, self.mode)
+
+    def _key(self):
+        key = super(ZonedDateRange, self)._key()
+        return key if len(key) < 3 else key + (self.mode, self._tz)
+
+    def _coordinate(self, when):
+        "Microseconds from the start in the range's mode"
+        utc = _utc_micros(when)
+        if self.mode == WALL:
+            utc += self._table.offset_at(utc)
+        return utc - self._origin
+
+    def _drops(self, low, high):
+        """
+        The grid indices dropped in wall mode between the grid indices low and high,
+        as (first, end) intervals. A dropped time falls into a gap and moving it
+        forward by the size of the gap would take it to or past the first point
+        after the gap.
+        """
+        step = self._step_us
+        walls = sorted((self._origin + low * step, self._origin + high * step))
+        drops = []
+
+        for start, size in self._table.gaps(*walls):
+            dropped = size // abs(step)
+            if not dropped:
+                continue
+            # grid index of the first point after the gap in the order of the range
+            if step > 0:
+                after = -(-(start + size - self._origin) // step)
+                drops.append((after - dropped, after))
+            else:
+                after = (start + size - self._origin) // step
+                drops.append((after + 1, after + 1 + dropped))
+        return drops
+
+    def _rank(self, grid):
+        "Index of the point at a grid index, a dropped one ranks like the next point"
+        if self.mode == ABSOLUTE:
+            return grid
+
+        drops = self._drops(min(grid, 0), max(grid, 0))
+        return grid - _dropped_before(drops, grid) + _dropped_before(drops, 0)
+
+    def _unrank(self, idx):
+        "Grid index of the point at idx, the inverse of _rank"
+        if self.mode == ABSOLUTE:
+            return idx
+
+        grid = idx
+        while True:
+            # skip the dropped indices between the start and grid until none are left
+            drops = self._drops(min(grid, 0), max(grid, 0) + 1)
+            following = (
+                idx
+                + _dropped_before(drops, grid + (idx >= 0))
+                - _dropped_before(drops, 0)
+            )
+            if following == grid:
+                return grid
+            grid = following
+
+    def _point_utc(self, idx):
+        if self.mode == WALL:
+            return self._table.to_utc(self._origin + self._step_us * self._unrank(idx))
+        return self._origin + self._step_us * idx
+
+    def _point(self, idx):
+        return self._aware(self._point_utc(idx))
+
+    def _aware(self, utc):
+        "The aware datetime of a UTC instant"
+        wall = utc + self._table.offset_at(utc)
+        # the second occurrence of an ambiguous wall time
+        fold = int(self._table.to_utc(wall) != utc)
+        return _naive(wall).replace(tzinfo=self._tz, fold=fold)
+
+    def _floor_index(self, x):
+        utc, idx = _utc_micros(x), self._rank(self._coordinate(x) // self._step_us)
+        if self.mode == WALL:
+            # shifted and dropped points can leave the wall clock estimate off
+            while self._before(utc, self._point_utc(idx)):
+                idx -= 1
+            while not self._before(utc, self._point_utc(idx + 1)):
+                idx += 1
+        return idx
+
+    def _ceil_index(self, x):
+        utc, idx = _utc_micros(x), self._rank(-(-self._coordinate(x) // self._step_us))
+        if self.mode == WALL:
+            while not self._before(self._point_utc(idx - 1), utc):
+                idx -= 1
+            while self._before(self._point_utc(idx), utc):
+                idx += 1
+        return idx
+
+    def _position(self, x):
+        if self.mode == ABSOLUTE:
+            idx, remainder = divmod(self._coordinate(x), self._step_us)
+        else:
+            idx = self._floor_index(x)
+            remainder = self._point_utc(idx) != _utc_micros(x)
+
+        if remainder or idx < 0 or (self._len is not None and idx >= self._len):
+            return None
+        return idx
+
+    def __iter__(self):
+        if self.mode == ABSOLUTE:
+            indices = count() if self._len is None else range(self._len)
+            for idx in indices:
+                yield self._point(idx)
+            return
+
+        grids = self._grid()
+        if self._len is not None:
+            grids = islice(grids, self._len)
+        for grid in grids:
+            yield self._aware(self._table.to_utc(self._origin + self._step_us * grid))
+
+    def _grid(self):
+        """
+        The grid indices of the points in wall mode. The grid is walked a year at a
+        time skipping the dropped indices, rather than unranking every point.
+        """
+        window = max(366 * _DAY // abs(self._step_us), 1)
+        grid = self._unrank(0)
+
+        while True:
+            dropped = set()
+            for first, end in self._drops(grid, grid + window):
+                dropped.update(range(first, end))
+            for idx in range(grid, grid + window):
+                if idx not in dropped:
+                    yield idx
+            grid += window
+
+    def _bounds(self, origin):
+        raise TypeError("set operations are not supported by ZonedDateRange")
+
+    def _offsets(self, values):
+        "Like DateRange._offsets but datetime64 values are taken to be UTC instants"
+        np = require_numpy("ZonedDateRange lookups")
+        utc = np.asarray(values).astype("datetime64[us]").astype("int64")
+
+        if self.mode == WALL:
+            utc = utc + self._offsets_at(utc)
+        return utc - self._origin
+
+    def _offsets_at(self, utc):
+        np = require_numpy("ZonedDateRange lookups")
+        if not len(utc):
+            return utc
+
+        years = _naive(int(utc.min()) - _DAY).year, _naive(int(utc.max()) + _DAY).year
+        times, offsets = self._table.arrays(*years)
+        return offsets[np.searchsorted(times, utc, side="right") - 1]
+
+    def _positions(self, values):
+        if self.mode == ABSOLUTE:
+            return super(ZonedDateRange, self)._positions(values)
+
+        np = require_numpy("ZonedDateRange lookups")
+        utc = np.asarray(values).astype("datetime64[us]").astype("int64")
+        # floor rather than exact division so points moved out of a gap are found too
+        idx = self._grid_indices(values, "ZonedDateRange lookups", ceil=False)
+        found = (idx >= 0) & (self._points_utc(idx) == utc)
+
+        if self._len is not None:
+            found &= idx < self._len
+        return idx, found
+
+    def _resolve(self, moments):
+        "Vectorized _Transitions.to_utc for an array of wall clock microseconds"
+        np = require_numpy("ZonedDateRange lookups")
+        if not len(moments):
+            return moments
+
+        before = self._offsets_at(moments - _DAY)
+        after = self._offsets_at(moments + _DAY)
+        early, late = moments - before, moments - after
+        early_ok = self._offsets_at(early) == before
+        late_ok = self._offsets_at(late) == after
+        return np.where(
+            early_ok & late_ok,
+            np.minimum(early, late),
+            np.where(late_ok & ~early_ok, late, early),
+        )
+
+    def _grid_indices(self, values, feature, ceil):
+        idx = super(ZonedDateRange, self)._grid_indices(values, feature, ceil)
+        if self.mode == ABSOLUTE:
+            return idx
+
+        # like _floor_index and _ceil_index, shifted and dropped points can leave the
+        # wall clock estimate off
+        np = require_numpy(feature)
+        utc = np.asarray(values).astype("datetime64[us]").astype("int64")
+        before = np.less if self._forward else np.greater
+        idx = self._ranks(np, idx)
+
+        def shift(idx, needed, by):
+            moving = needed(idx)
+            while moving.any():
+                idx = idx + by * moving
+                moving = needed(idx)
+            return idx
+
+        if ceil:
+            idx = shift(idx, lambda idx: ~before(self._points_utc(idx - 1), utc), -1)
+            return shift(idx, lambda idx: before(self._points_utc(idx), utc), 1)
+
+        idx = shift(idx, lambda idx: before(utc, self._points_utc(idx)), -1)
+        return shift(idx, lambda idx: ~before(utc, self._points_utc(idx + 1)), 1)
+
+    def _drop_arrays(self, np, low, high):
+        "_drops as an array of intervals, with the number dropped before the start"
+        drops = self._drops(min(low, 0), max(high, 0) + 1)
+        intervals = np.array(drops, dtype="int64").reshape(-1, 2)
+        return intervals, _dropped_before(drops, 0)
+
+    @staticmethod
+    def _dropped_before_array(np, intervals, indices):
+        first, end = intervals[:, 0], intervals[:, 1]
+        return np.clip(indices[:, None] - first, 0, end - first).sum(axis=1)
+
+    def _ranks(self, np, grid):
+        "Vectorized _rank"
+        if self.mode == ABSOLUTE or not len(grid):
+            return grid
+
+        intervals, start = self._drop_arrays(np, int(grid.min()), int(grid.max()))
+        return grid - self._dropped_before_array(np, intervals, grid) + start
+
+    def _unranks(self, np, indices):
+        "Vectorized _unrank"
+        if self.mode == ABSOLUTE or not len(indices):
+            return indices
+
+        grid = indices
+        while True:
+            intervals, start = self._drop_arrays(np, int(grid.min()), int(grid.max()))
+            after = grid + (indices >= 0)
+            following = (
+                indices + self._dropped_before_array(np, intervals, after) - start
+            )
+            if (following == grid).all():
+                return grid
+            grid = following
+
+    def _points_utc(self, indices):
+        "Vectorized _point_utc"
+        np = require_numpy("ZonedDateRange lookups")
+        if self.mode == ABSOLUTE:
+            return self._origin + indices * self._step_us
+        return self._resolve(self._origin + self._unranks(np, indices) * self._step_us)
+
+    def _points(self, indices):
+        return self._points_utc(indices).astype("datetime64[us]")
@@ -1,4 +1,12 @@
 import datetime
+import sys
+
+import pytest
+
+# the asyncio tests use async syntax and asyncio.run from Python 3.7
+collect_ignore = []
+if sys.version_info < (3, 7):
+    collect_ignore.extend(["test_ticker.py", "test_clock.py"])
 
 
 # stub out non-deterministic methods with raising alternatives
@@ -7,9 +15,30 @@ def nondeterminism(*a, **k):
     raise RuntimeError("Relying on non-determinism")
 
 
-datetime.date = type("RaisingDate", (datetime.date,), {"today": nondeterminism})
-datetime.datetime = type(
+# bound to module level names as well so ranges can be pickled into worker processes
+RaisingDate = datetime.date = type(
+    "RaisingDate", (datetime.date,), {"today": nondeterminism}
+)
+RaisingDateTIme = datetime.datetime = type(
     "RaisingDateTIme",
     (datetime.datetime,),
     {"now": nondeterminism, "utcnow": nondeterminism, "today": nondeterminism},
 )
+
+
+class _CountingClock(object):
+    "Clock returning a fixed moment that counts how often it is called"
+
+    def __init__(self, when):
+        self.when = when
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.when
+
+
+@pytest.fixture
+def counting_clock():
+    "Factory for clocks returning a fixed moment that count how often they are called"
+    return _CountingClock
@@ -0,0 +1,86 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from datestuff import Bounds, RelativeDate, RelativeDateTime
+
+TODAY = date(2016, 1, 1)
+NOW = datetime(2016, 1, 1, 12)
+
+
+@pytest.fixture
+def clock(counting_clock):
+    return counting_clock(TODAY)
+
+
+@pytest.fixture
+def last_30_days(clock):
+    return Bounds(
+        RelativeDate(offset=timedelta(days=-30), clock=clock), RelativeDate(clock=clock)
+    )
+
+
+def test_mask_resolves_the_clock_once(last_30_days, clock):
+    values = [TODAY - timedelta(days=days) for days in range(-2, 40)]
+
+    mask = last_30_days.mask(values)
+
+    assert mask == [1 <= days <= 30 for days in range(-2, 40)]
+    assert clock.calls == 1
+
+
+def test_contains(last_30_days, clock):
+    assert date(2015, 12, 2) in last_30_days
+    assert date(2015, 12, 1) not in last_30_days
+    assert TODAY not in last_30_days
+    assert clock.calls == 3
+
+
+def test_inclusivity(clock):
+    bounds = Bounds(
+        RelativeDate(clock=clock),
+        RelativeDate(offset=timedelta(days=1), clock=clock),
+        lower_inclusive=False,
+        upper_inclusive=True,
+    )
+
+    assert bounds.mask([TODAY, TODAY + timedelta(days=1)]) == [False, True]
+
+
+def test_open_and_static_bounds():
+    assert Bounds(upper=TODAY).mask([date(1, 1, 1), TODAY]) == [True, False]
+    assert Bounds(lower=TODAY).mask([date(1, 1, 1), TODAY]) == [False, True]
+    assert Bounds().mask([TODAY]) == [True]
+
+
+def test_resolve(last_30_days):
+    assert last_30_days.resolve() == (date(2015, 12, 2), TODAY)
+
+
+def test_mask_datetime64_array(counting_clock):
+    np = pytest.importorskip("numpy")
+    clock = counting_clock(NOW)
+    bounds = Bounds(
+        RelativeDateTime(offset=timedelta(hours=-1), clock=clock),
+        RelativeDateTime(clock=clock),
+    )
+    values = np.array(
+        [
+            "2016-01-01T10:59",
+            "2016-01-01T11:00",
+            "2016-01-01T11:59",
+            "2016-01-01T12:00",
+        ],
+        dtype="datetime64[us]",
+    )
+
+    assert bounds.mask(values).tolist() == [False, True, True, False]
+    assert clock.calls == 1
+
+
+def test_mask_datetime64_array_with_date_bounds(last_30_days):
+    np = pytest.importorskip("numpy")
+    values = np.array(
+        ["2015-12-01", "2015-12-02", "2016-01-01"], dtype="datetime64[D]"
+    )
+
+    assert last_30_days.mask(values).tolist() == [False, True, False]
@@ -0,0 +1,148 @@
+import pickle
+from datetime import date, datetime, timedelta
+
+import pytest
+from datestuff import BusinessCalendar, BusinessDayRange, DateRange, RelativeDate
+
+# 2024-01-01 is a Monday
+NEW_YEAR = date(2024, 1, 1)
+HOLIDAYS = [date(2024, 1, 1), date(2024, 3, 29), date(2024, 4, 1), date(2024, 4, 6)]
+
+
+@pytest.fixture
+def calendar():
+    return BusinessCalendar(holidays=HOLIDAYS)
+
+
+def brute_force(start, stop, calendar):
+    days = DateRange(start, stop, timedelta(days=1))
+    return [d for d in days if d.weekday() < 5 and d not in HOLIDAYS]
+
+
+def test_weekmask_and_holidays(calendar):
+    assert calendar.is_busday(date(2024, 1, 2))
+    assert not calendar.is_busday(NEW_YEAR)
+    assert not calendar.is_busday(date(2024, 1, 6))
+    # a holiday on a weekend changes nothing
+    assert calendar.holidays == (date(2024, 1, 1), date(2024, 3, 29), date(2024, 4, 1))
+
+
+def test_custom_weekmask():
+    calendar = BusinessCalendar("0000011")
+
+    assert calendar.is_busday(date(2024, 1, 6))
+    assert not calendar.is_busday(date(2024, 1, 5))
+    assert calendar == BusinessCalendar([0, 0, 0, 0, 0, 1, 1])
+
+
+@pytest.mark.parametrize("weekmask", ["1111", "11111x0", "0000000", [1, 0]])
+def test_invalid_weekmask(weekmask):
+    with pytest.raises(ValueError):
+        BusinessCalendar(weekmask)
+
+
+def test_offset_rolls_and_moves(calendar):
+    assert calendar.offset(date(2024, 3, 28), 1) == date(2024, 4, 2)
+    assert calendar.offset(date(2024, 3, 30), 0) == date(2024, 4, 2)
+    assert calendar.offset(date(2024, 3, 30), 0, roll="backward") == date(2024, 3, 28)
+    assert calendar.offset(date(2024, 4, 2), -2) == date(2024, 3, 27)
+
+    with pytest.raises(ValueError):
+        calendar.offset(date(2024, 3, 30), 1, roll="raise")
+
+
+def test_count(calendar):
+    assert calendar.count(date(2024, 3, 25), date(2024, 4, 8)) == 8
+    assert calendar.count(date(2024, 4, 8), date(2024, 3, 25)) == -8
+
+
+def test_matches_filtering_a_daily_range(calendar):
+    dr = BusinessDayRange(NEW_YEAR, date(2025, 1, 1), calendar=calendar)
+    expected = brute_force(NEW_YEAR, date(2025, 1, 1), calendar)
+
+    assert list(dr) == expected
+    assert len(dr) == len(expected)
+    assert dr[100] == expected[100]
+    assert dr[-1] == expected[-1]
+    assert dr.start == date(2024, 1, 2)
+
+
+def test_membership_and_index(calendar):
+    dr = BusinessDayRange(NEW_YEAR, date(2025, 1, 1), calendar=calendar)
+
+    assert date(2024, 4, 2) in dr
+    assert date(2024, 4, 1) not in dr
+    assert date(2024, 4, 6) not in dr
+    assert dr.index(date(2024, 4, 2)) == 63
+
+    with pytest.raises(ValueError):
+        dr.index(date(2024, 3, 29))
+
+
+def test_far_indexing_with_weekly_step():
+    dr = BusinessDayRange(NEW_YEAR, step=5)
+
+    assert dr[52000] == NEW_YEAR + timedelta(weeks=52000)
+
+
+def test_slicing_and_stepping(calendar):
+    dr = BusinessDayRange(NEW_YEAR, date(2024, 6, 1), calendar=calendar)
+    expected = brute_force(NEW_YEAR, date(2024, 6, 1), calendar)
+
+    assert isinstance(dr[::3], BusinessDayRange)
+    assert list(dr[5:40:3]) == expected[5:40:3]
+    assert list(dr[::-1]) == expected[::-1]
+
+
+def test_negative_step_rolls_backward(calendar):
+    dr = BusinessDayRange(date(2024, 4, 1), date(2024, 3, 20), -1, calendar)
+
+    assert dr.start == date(2024, 3, 28)
+    assert list(dr) == brute_force(date(2024, 3, 21), date(2024, 3, 29), calendar)[::-1]
+
+
+def test_rejects_datetimes():
+    with pytest.raises(TypeError):
+        BusinessDayRange(datetime(2024, 1, 1))
+
+
+def test_resolves_relative_bounds(calendar):
+    stop = RelativeDate(clock=lambda: date(2024, 1, 12))
+    dr = BusinessDayRange(NEW_YEAR, stop, calendar=calendar)
+
+    assert type(dr.stop) is date
+    assert dr.stop == date(2024, 1, 12)
+    assert list(dr) == brute_force(NEW_YEAR, date(2024, 1, 12), calendar)
+
+
+def test_equality_and_pickle(calendar):
+    dr = BusinessDayRange(NEW_YEAR, date(2024, 2, 3), calendar=calendar)
+
+    # the same points spelled with a rolled start and a weekend stop
+    same = BusinessDayRange(date(2024, 1, 2), date(2024, 2, 3), calendar=calendar)
+
+    assert dr == same
+    assert dr != BusinessDayRange(NEW_YEAR, date(2024, 2, 1))
+    assert pickle.loads(pickle.dumps(dr)) == dr
+
+
+def test_batch_lookups(calendar):
+    np = pytest.importorskip("numpy")
+    dr = BusinessDayRange(NEW_YEAR, date(2024, 6, 1), calendar=calendar)
+    days = np.arange("2023-12-20", "2024-06-10", dtype="datetime64[D]")
+    objects = days.astype(object)
+
+    assert dr.to_numpy().astype(object).tolist() == list(dr)
+    assert dr.count(days).tolist() == [int(d in dr) for d in objects]
+    assert dr.searchsorted(days).tolist() == [dr.searchsorted(d) for d in objects]
+    assert dr.bucketize(days).tolist() == [
+        -1 if dr.bucket_of(d) is None else dr.bucket_of(d) for d in objects
+    ]
+
+
+def test_floor_and_ceil_to_business_days(calendar):
+    dr = BusinessDayRange(NEW_YEAR, calendar=calendar)
+
+    assert dr.floor(date(2024, 3, 31)) == date(2024, 3, 28)
+    assert dr.ceil(date(2024, 3, 31)) == date(2024, 4, 2)
+    assert dr.round(date(2024, 3, 30)) == date(2024, 3, 28)
@@ -0,0 +1,94 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from itertools import count
+
+import pytest
+from datestuff import CoarseClock, RelativeDateTime
+
+START = datetime(2016, 1, 1)
+
+
+class SteppingFactory(object):
+    "Returns a new moment one second later on every call"
+
+    def __init__(self):
+        self.calls = 0
+        self._seconds = count()
+
+    def __call__(self):
+        self.calls += 1
+        return START + timedelta(seconds=next(self._seconds))
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_calls_factory_when_not_running():
+    factory = SteppingFactory()
+    clock = CoarseClock(factory=factory)
+
+    assert clock() == START
+    assert clock() == START + timedelta(seconds=1)
+    assert not clock.running
+
+
+def test_thread_refreshes_shared_value():
+    factory = SteppingFactory()
+
+    with CoarseClock(resolution=0.01, factory=factory) as clock:
+        assert clock.running
+        first = clock()
+        calls = factory.calls
+
+        # reads between refreshes don't call the factory
+        for _ in range(100):
+            clock()
+        assert factory.calls - calls < 100
+
+        wait_for(lambda: clock() > first)
+
+    assert not clock.running
+    assert clock() == START + timedelta(seconds=factory.calls - 1)
+
+
+def test_refreshes_on_event_loop():
+    factory = SteppingFactory()
+    clock = CoarseClock(resolution=0.01, factory=factory)
+
+    async def main():
+        clock.start(asyncio.get_running_loop())
+        first = clock()
+        assert clock() is first
+
+        while clock() == first:
+            await asyncio.sleep(0.005)
+        clock.stop()
+
+    asyncio.run(asyncio.wait_for(main(), 5))
+
+    assert not clock.running
+    assert factory.calls >= 2
+
+
+def test_cannot_start_twice():
+    with CoarseClock(factory=SteppingFactory()) as clock:
+        with pytest.raises(RuntimeError):
+            clock.start()
+
+
+def test_invalid_resolution():
+    with pytest.raises(ValueError):
+        CoarseClock(resolution=0)
+
+
+def test_as_relative_clock():
+    with CoarseClock(resolution=60, factory=lambda: START) as clock:
+        recent = RelativeDateTime(offset=timedelta(minutes=-5), clock=clock)
+
+        assert recent == START - timedelta(minutes=5)
+        assert START - timedelta(minutes=1) > recent
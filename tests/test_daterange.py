@@ -1,4 +1,4 @@
-from datestuff import DateRange
+from datestuff import DateRange, RelativeDate
 from datetime import date, datetime, timedelta
 import pytest
 
@@ -234,3 +234,690 @@ def test_full_slice():
     )
 
     assert dr == expected
+
+
+def test_to_numpy_with_datetimes():
+    np = pytest.importorskip("numpy")
+    dr = DateRange(
+        start=datetime(2016, 1, 1), stop=datetime(2016, 1, 2), step=timedelta(hours=5)
+    )
+
+    exported = dr.to_numpy()
+
+    assert exported.dtype == np.dtype("datetime64[us]")
+    assert exported.tolist() == list(dr)
+
+
+def test_to_numpy_with_dates_and_negative_step():
+    np = pytest.importorskip("numpy")
+    dr = DateRange(
+        start=date(2016, 1, 31), stop=date(2015, 12, 1), step=timedelta(days=-3)
+    )
+
+    exported = dr.to_numpy()
+
+    assert exported.dtype == np.dtype("datetime64[D]")
+    assert exported.tolist() == list(dr)
+
+
+def test_to_numpy_on_slice():
+    pytest.importorskip("numpy")
+    dr = DateRange(
+        start=datetime(2016, 1, 1), stop=datetime(2016, 2, 1), step=timedelta(days=1)
+    )
+
+    assert dr[1:-1:2].to_numpy().tolist() == list(dr)[1:-1:2]
+
+
+def test_to_numpy_refuses_infinite_range():
+    pytest.importorskip("numpy")
+    dr = DateRange(start=datetime(2016, 1, 1), step=timedelta(days=1))
+
+    with pytest.raises(TypeError):
+        dr.to_numpy()
+
+
+def test_iter_batches_on_infinite_range():
+    pytest.importorskip("numpy")
+    dr = DateRange(start=date(2016, 1, 1), step=timedelta(days=1))
+    batches = dr.iter_batches(3)
+
+    assert next(batches).tolist() == [date(2016, 1, x) for x in range(1, 4)]
+    assert next(batches).tolist() == [date(2016, 1, x) for x in range(4, 7)]
+
+
+def test_iter_batches_covers_finite_range():
+    pytest.importorskip("numpy")
+    dr = DateRange(
+        start=date(2016, 1, 1), stop=date(2016, 1, 11), step=timedelta(days=1)
+    )
+
+    batches = [batch.tolist() for batch in dr.iter_batches(4)]
+
+    assert [len(b) for b in batches] == [4, 4, 2]
+    assert sum(batches, []) == list(dr)
+
+
+def test_iter_batches_rejects_non_positive_sizes():
+    dr = DateRange(start=date(2016, 1, 1), step=timedelta(days=1))
+
+    with pytest.raises(ValueError):
+        dr.iter_batches(0)
+
+
+def test_length_is_exact_across_decades_at_microsecond_steps():
+    dr = DateRange(
+        start=datetime(1970, 1, 1),
+        stop=datetime(2038, 1, 19, 3, 14, 7, 1),
+        step=timedelta(microseconds=1),
+    )
+
+    assert len(dr) == (2 ** 31 - 1) * 10 ** 6 + 1
+    assert datetime(2038, 1, 19, 3, 14, 7) in dr
+    assert dr[-1] == datetime(2038, 1, 19, 3, 14, 7)
+
+
+def test_membership_is_exact_across_decades_at_microsecond_steps():
+    dr = DateRange(start=datetime(1900, 1, 1), step=timedelta(microseconds=3))
+
+    assert datetime(2100, 1, 1, 0, 0, 0, 3) in dr
+    assert datetime(2100, 1, 1, 0, 0, 0, 1) not in dr
+
+
+def test_length_is_zero_when_stop_is_behind_start():
+    dr = DateRange(
+        start=date(2016, 1, 31), stop=date(2016, 1, 1), step=timedelta(days=1)
+    )
+
+    assert len(dr) == 0
+    assert date(2016, 1, 31) not in dr
+
+
+def test_length_with_stop_off_the_grid():
+    dr = DateRange(
+        start=datetime(2016, 1, 1),
+        stop=datetime(2016, 1, 1, 1),
+        step=timedelta(minutes=7),
+    )
+
+    assert len(dr) == len(list(dr)) == 9
+
+
+def test_relative_bounds_are_resolved_when_created():
+    start = RelativeDate(clock=lambda: date(2016, 1, 1))
+    dr = DateRange(start, date(2016, 1, 6), timedelta(days=1))
+
+    assert dr.start == date(2016, 1, 1)
+    assert len(dr) == len(list(dr)) == 5
+    assert date(2016, 1, 3) in dr
+    assert dr.index(date(2016, 1, 3)) == 2
+
+
+@pytest.mark.parametrize(
+    "s",
+    [
+        slice(None, None, -1),
+        slice(-2, 3, -3),
+        slice(5, None, 4),
+        slice(None, -4),
+        slice(10, 2),
+        slice(100, None),
+        slice(None, 0),
+    ],
+)
+def test_slicing_matches_list_slicing(s):
+    dr = DateRange(
+        start=datetime(2016, 1, 1), stop=datetime(2016, 1, 20), step=timedelta(days=1)
+    )
+
+    assert list(dr[s]) == list(dr)[s]
+    assert len(dr[s]) == len(list(dr)[s])
+
+
+def test_reverse_slicing_infinite_range_with_start():
+    dr = DateRange(start=date(2016, 1, 1), step=timedelta(days=1))
+
+    assert list(dr[3::-1]) == [date(2016, 1, x) for x in range(4, 0, -1)]
+
+
+def test_reverse_slicing_infinite_range_requires_start():
+    dr = DateRange(start=date(2016, 1, 1), step=timedelta(days=1))
+
+    with pytest.raises(IndexError):
+        dr[::-1]
+
+
+def _brute_force(dr, other):
+    return sorted(set(dr) & set(other))
+
+
+def test_intersection_of_offset_schedules():
+    quarter_hours = DateRange(
+        datetime(2016, 1, 1, 9), datetime(2016, 1, 1, 17), timedelta(minutes=15)
+    )
+    six_minutes = DateRange(
+        datetime(2016, 1, 1, 9, 3), datetime(2016, 1, 1, 12), timedelta(minutes=6)
+    )
+
+    shared = quarter_hours.intersection(six_minutes)
+
+    assert shared.step == timedelta(minutes=30)
+    assert shared[0] == datetime(2016, 1, 1, 9, 15)
+    assert list(shared) == _brute_force(quarter_hours, six_minutes)
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        DateRange(date(2016, 1, 2), date(2016, 3, 1), timedelta(days=4)),
+        DateRange(date(2016, 2, 20), date(2015, 12, 1), timedelta(days=-6)),
+        DateRange(date(2016, 1, 3), date(2016, 3, 1), timedelta(days=4)),
+        DateRange(date(2016, 1, 2), date(2016, 1, 2), timedelta(days=4)),
+    ],
+)
+def test_intersection_matches_brute_force(other):
+    dr = DateRange(date(2016, 1, 1), date(2016, 2, 15), timedelta(days=3))
+
+    assert list(dr.intersection(other)) == _brute_force(dr, other)
+    assert sorted(other.intersection(dr)) == _brute_force(dr, other)
+    assert dr.isdisjoint(other) == (not _brute_force(dr, other))
+
+
+def test_intersection_of_infinite_ranges():
+    forward = DateRange(date(2016, 1, 1), step=timedelta(days=2))
+    backward = DateRange(date(2016, 2, 1), step=timedelta(days=-3))
+
+    shared = forward.intersection(backward)
+
+    assert list(shared) == _brute_force(
+        forward[:100], DateRange(date(2016, 2, 1), date(2015, 12, 1), -timedelta(3))
+    )
+    assert forward.intersection(forward[5:]) == forward[5:]
+
+
+def test_issubset():
+    dr = DateRange(date(2016, 1, 1), step=timedelta(days=2))
+
+    assert dr[3:10:2].issubset(dr)
+    assert dr[3:10].issubset(dr[1:])
+    assert not dr[:10].issubset(dr[1:])
+    assert not DateRange(date(2016, 1, 2), step=timedelta(days=4)).issubset(dr)
+    assert dr.issuperset(dr[::3])
+    assert DateRange(date(2016, 1, 2), date(2016, 1, 1), timedelta(1)).issubset(dr)
+
+
+def test_union_of_overlapping_ranges():
+    dr = DateRange(date(2016, 1, 1), date(2016, 1, 11), timedelta(days=1))
+    other = DateRange(date(2016, 1, 20), date(2016, 1, 5), timedelta(days=-1))
+
+    assert list(dr.union(other)) == sorted(set(dr) | set(other))
+    assert dr.union(dr[::2]) == dr
+
+
+def test_union_of_adjacent_ranges_and_points():
+    dr = DateRange(date(2016, 1, 1), date(2016, 1, 11), timedelta(days=2))
+
+    assert list(dr.union(dr[-1:].intersection(dr))) == list(dr)
+    assert list(dr[:2].union(dr[2:])) == list(dr)
+    assert list(dr[:1].union(dr[3:4])) == [date(2016, 1, 1), date(2016, 1, 7)]
+
+
+def test_union_refuses_gaps():
+    dr = DateRange(date(2016, 1, 1), date(2016, 1, 11), timedelta(days=1))
+
+    with pytest.raises(ValueError):
+        dr[:2].union(dr[5:])
+
+    with pytest.raises(ValueError):
+        dr.union(DateRange(date(2016, 1, 1), step=timedelta(days=3)))
+
+
+def test_union_refuses_ranges_unbounded_both_ways():
+    forward = DateRange(date(2016, 1, 1), step=timedelta(days=1))
+    backward = DateRange(date(2016, 1, 1), step=timedelta(days=-1))
+
+    with pytest.raises(ValueError):
+        forward.union(backward)
+
+
+def test_difference():
+    dr = DateRange(date(2016, 1, 1), date(2016, 1, 11), timedelta(days=1))
+
+    assert list(dr.difference(dr[4:])) == list(dr)[:4]
+    assert list(dr.difference(dr[:4])) == list(dr)[4:]
+    assert list(dr.difference(dr)) == []
+    assert dr.difference(DateRange(date(2017, 1, 1), step=timedelta(1))) == dr
+
+    with pytest.raises(ValueError):
+        dr.difference(dr[3:5])
+
+
+def test_index_and_count():
+    dr = DateRange(date(2016, 1, 1), date(2016, 2, 1), timedelta(days=3))
+
+    assert dr.index(date(2016, 1, 10)) == list(dr).index(date(2016, 1, 10))
+    assert dr.count(date(2016, 1, 10)) == 1
+    assert dr.count(date(2016, 1, 11)) == 0
+
+    with pytest.raises(ValueError):
+        dr.index(date(2016, 1, 11))
+
+
+@pytest.mark.parametrize("side", ["left", "right"])
+@pytest.mark.parametrize(
+    "when",
+    [datetime(2016, 1, 1, x) for x in range(0, 24, 5)]
+    + [datetime(2015, 12, 31), datetime(2016, 1, 2)],
+)
+def test_searchsorted_matches_bisect(side, when):
+    import bisect
+
+    dr = DateRange(
+        datetime(2016, 1, 1, 1), datetime(2016, 1, 1, 20), timedelta(minutes=50)
+    )
+    bisector = bisect.bisect_left if side == "left" else bisect.bisect_right
+
+    assert dr.searchsorted(when, side=side) == bisector(list(dr), when)
+
+
+def test_searchsorted_with_negative_step():
+    dr = DateRange(date(2016, 1, 31), date(2016, 1, 1), timedelta(days=-2))
+
+    assert dr.searchsorted(date(2016, 1, 29)) == 1
+    assert dr.searchsorted(date(2016, 1, 29), side="right") == 2
+    assert dr.searchsorted(date(2016, 1, 28)) == 2
+    assert dr.searchsorted(date(2017, 1, 1)) == 0
+    assert dr.searchsorted(date(2015, 1, 1)) == len(dr)
+
+
+def test_searchsorted_rejects_unknown_side():
+    dr = DateRange(date(2016, 1, 1), step=timedelta(days=1))
+
+    with pytest.raises(ValueError):
+        dr.searchsorted(date(2016, 1, 1), side="middle")
+
+
+def test_batch_lookups_with_numpy():
+    np = pytest.importorskip("numpy")
+    dr = DateRange(date(2016, 1, 1), date(2016, 2, 1), timedelta(days=3))
+    values = np.array(["2016-01-04", "2016-01-05", "2016-02-03"], dtype="datetime64[D]")
+
+    assert dr.count(values).tolist() == [1, 0, 0]
+    assert dr.searchsorted(values).tolist() == [1, 2, len(dr)]
+    assert dr.searchsorted(values, side="right").tolist() == [2, 2, len(dr)]
+    assert dr.index(values[:1]).tolist() == [1]
+
+    with pytest.raises(ValueError):
+        dr.index(values)
+
+
+class TestCalendarSteps(object):
+    relativedelta = pytest.importorskip("dateutil.relativedelta").relativedelta
+    monthly = relativedelta(months=1)
+
+    def test_month_ends_are_clamped_without_drifting(self):
+        dr = DateRange(date(2016, 1, 31), date(2016, 6, 1), self.monthly)
+
+        assert list(dr) == [
+            date(2016, 1, 31),
+            date(2016, 2, 29),
+            date(2016, 3, 31),
+            date(2016, 4, 30),
+            date(2016, 5, 31),
+        ]
+        assert len(dr) == 5
+
+    def test_last_day_of_month(self):
+        dr = DateRange(
+            date(2016, 2, 29), date(2016, 5, 1), self.relativedelta(months=1), -1
+        )
+
+        assert list(dr) == [date(2016, 2, 29), date(2016, 3, 31), date(2016, 4, 30)]
+
+    def test_start_must_fall_on_month_day(self):
+        with pytest.raises(ValueError):
+            DateRange(date(2016, 1, 30), step=self.monthly, month_day=-1)
+
+    @pytest.mark.parametrize("month_day", [0, -2, 32, 40])
+    def test_rejects_month_day_out_of_range(self, month_day):
+        with pytest.raises(ValueError, match="between 1 and 31 or -1"):
+            DateRange(date(2016, 1, 31), step=self.monthly, month_day=month_day)
+
+    def test_month_day_requires_calendar_step(self):
+        with pytest.raises(TypeError):
+            DateRange(date(2016, 1, 31), step=timedelta(days=1), month_day=-1)
+
+    @pytest.mark.parametrize(
+        "step", [{"days": 1}, {"months": 1, "hours": 2}, {"months": 1, "day": 3}]
+    )
+    def test_rejects_non_calendar_relativedeltas(self, step):
+        with pytest.raises(TypeError):
+            DateRange(date(2016, 1, 1), step=self.relativedelta(**step))
+
+    def test_rejects_zero_calendar_step(self):
+        with pytest.raises(TypeError):
+            DateRange(date(2016, 1, 1), step=self.relativedelta(months=0))
+
+    def test_index_far_into_infinite_range(self):
+        dr = DateRange(datetime(2016, 1, 31, 9), step=self.relativedelta(months=1))
+
+        assert dr[10000] == datetime(2849, 5, 31, 9)
+        assert dr[10001] == datetime(2849, 6, 30, 9)
+        assert datetime(2849, 6, 30, 9) in dr
+        assert datetime(2849, 6, 30, 10) not in dr
+        assert dr.index(datetime(2849, 6, 30, 9)) == 10001
+
+    def test_years_and_negative_steps(self):
+        dr = DateRange(
+            date(2020, 2, 29), date(2011, 1, 1), self.relativedelta(years=-2, months=-1)
+        )
+
+        assert list(dr) == [dr[i] for i in range(len(dr))]
+        assert list(dr) == [
+            date(2020, 2, 29),
+            date(2018, 1, 29),
+            date(2015, 12, 29),
+            date(2013, 11, 29),
+            date(2011, 10, 29),
+        ]
+        assert date(2013, 11, 29) in dr
+        assert date(2010, 9, 29) not in dr
+
+    def test_stop_within_the_last_month(self):
+        step = self.relativedelta(months=1)
+
+        assert len(DateRange(date(2016, 1, 15), date(2016, 3, 15), step)) == 2
+        assert len(DateRange(date(2016, 1, 15), date(2016, 3, 16), step)) == 3
+        assert len(DateRange(date(2016, 1, 15), date(2016, 3, 1), step)) == 2
+
+    def test_slices_keep_the_month_day(self):
+        dr = DateRange(date(2016, 1, 31), date(2017, 1, 1), self.monthly)
+
+        assert list(dr[1::2]) == list(dr)[1::2]
+        assert list(dr[::-3]) == list(dr)[::-3]
+        assert len(dr[1:-1]) == len(dr) - 2
+
+    def test_searchsorted(self):
+        dr = DateRange(date(2016, 1, 31), date(2017, 1, 1), self.monthly)
+
+        assert dr.searchsorted(date(2016, 2, 29)) == 1
+        assert dr.searchsorted(date(2016, 2, 29), side="right") == 2
+        assert dr.searchsorted(date(2016, 3, 1)) == 2
+        assert dr.searchsorted(date(2015, 3, 1)) == 0
+
+    def test_to_numpy(self):
+        pytest.importorskip("numpy")
+        dr = DateRange(
+            datetime(2016, 1, 31, 12, 30), step=self.relativedelta(months=1)
+        )[:30]
+
+        assert dr.to_numpy().tolist() == list(dr)
+
+    def test_set_operations_are_unsupported(self):
+        dr = DateRange(date(2016, 1, 31), step=self.relativedelta(months=1))
+
+        with pytest.raises(TypeError):
+            dr.intersection(dr)
+
+
+def test_chunks():
+    dr = DateRange(date(2016, 1, 1), date(2016, 1, 11), timedelta(days=1))
+
+    chunks = list(dr.chunks(4))
+
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    assert [list(c) for c in chunks] == [list(dr)[i:][:4] for i in range(0, 10, 4)]
+
+
+def test_chunks_of_infinite_range():
+    dr = DateRange(date(2016, 1, 1), step=timedelta(days=1))
+    chunks = dr.chunks(7)
+
+    next(chunks)
+    assert next(chunks) == dr[7:14]
+
+
+def test_split_into_near_equal_parts():
+    dr = DateRange(datetime(2016, 1, 1), datetime(2016, 1, 2), timedelta(hours=1))
+
+    parts = list(dr.split(5))
+
+    assert [len(p) for p in parts] == [5, 5, 5, 5, 4]
+    assert sum((list(p) for p in parts), []) == list(dr)
+
+
+def test_split_with_more_parts_than_points():
+    dr = DateRange(date(2016, 1, 1), date(2016, 1, 3), timedelta(days=1))
+
+    assert [len(p) for p in dr.split(4)] == [1, 1, 0, 0]
+
+
+def test_split_refuses_infinite_range():
+    with pytest.raises(TypeError):
+        DateRange(date(2016, 1, 1), step=timedelta(days=1)).split(2)
+
+
+def test_windows():
+    dr = DateRange(date(2016, 1, 1), date(2016, 1, 8), timedelta(days=1))
+    points = list(dr)
+
+    windows = [list(w) for w in dr.windows(3, stride=2)]
+
+    assert windows == [points[0:3], points[2:5], points[4:7]]
+    assert list(dr.windows(8)) == []
+
+
+@pytest.mark.parametrize("method", ["chunks", "split", "windows"])
+def test_partitioning_rejects_non_positive_sizes(method):
+    dr = DateRange(date(2016, 1, 1), date(2016, 1, 8), timedelta(days=1))
+
+    with pytest.raises(ValueError):
+        getattr(dr, method)(0)
+
+
+def test_is_slotted_and_immutable():
+    dr = DateRange(date(2016, 1, 1), date(2016, 2, 1), timedelta(days=1))
+
+    assert not hasattr(dr, "__dict__")
+
+    with pytest.raises(AttributeError):
+        dr.start = date(2015, 1, 1)
+
+    with pytest.raises(AttributeError):
+        del dr.stop
+
+
+def test_pickles_and_copies():
+    import copy
+    import pickle
+
+    dr = DateRange(date(2016, 1, 1), date(2016, 2, 1), timedelta(days=1))
+
+    assert pickle.loads(pickle.dumps(dr)) == dr
+    assert copy.copy(dr) == dr
+    assert copy.deepcopy(dr) == dr
+
+
+def test_bucket_of():
+    dr = DateRange(
+        datetime(2016, 1, 1), datetime(2016, 1, 1, 1), timedelta(minutes=15)
+    )
+
+    assert dr.bucket_of(datetime(2016, 1, 1)) == 0
+    assert dr.bucket_of(datetime(2016, 1, 1, 0, 29, 59)) == 1
+    assert dr.bucket_of(datetime(2016, 1, 1, 0, 59)) == 3
+    assert dr.bucket_of(datetime(2016, 1, 1, 1)) is None
+    assert dr.bucket_of(datetime(2015, 12, 31, 23, 59)) is None
+
+
+def test_bucket_of_with_negative_step():
+    dr = DateRange(date(2016, 1, 31), step=timedelta(days=-7))
+
+    assert dr.bucket_of(date(2016, 1, 31)) == 0
+    assert dr.bucket_of(date(2016, 1, 25)) == 0
+    assert dr.bucket_of(date(2016, 1, 24)) == 1
+    assert dr.bucket_of(date(2016, 2, 1)) is None
+
+
+def test_bucketize_and_histogram():
+    np = pytest.importorskip("numpy")
+    dr = DateRange(
+        datetime(2016, 1, 1), datetime(2016, 1, 1, 1), timedelta(minutes=15)
+    )
+    values = np.array(
+        [
+            "2016-01-01T00:01",
+            "2016-01-01T00:14",
+            "2016-01-01T00:50",
+            "2016-01-01T01:00",
+            "2015-12-31T23:59",
+        ],
+        dtype="datetime64[us]",
+    )
+
+    assert dr.bucketize(values).tolist() == [0, 0, 3, -1, -1]
+    assert dr.bucketize(values.astype(object).tolist()).tolist() == [0, 0, 3, -1, -1]
+    assert dr.histogram(values).tolist() == [2, 0, 0, 1]
+
+
+def test_bucketize_with_calendar_steps():
+    pytest.importorskip("numpy")
+    relativedelta = pytest.importorskip("dateutil.relativedelta").relativedelta
+    dr = DateRange(date(2016, 1, 31), date(2016, 5, 1), relativedelta(months=1))
+    values = [date(2016, 2, 28), date(2016, 2, 29), date(2016, 4, 30), date(2016, 6, 1)]
+
+    assert dr.bucketize(values).tolist() == [0, 1, 3, -1]
+    assert dr.histogram(values).tolist() == [1, 1, 0, 1]
+
+
+def test_floor_ceil_and_round():
+    dr = DateRange(datetime(2016, 1, 1, 0, 2), step=timedelta(minutes=5))
+
+    assert dr.floor(datetime(2016, 1, 1, 9, 14, 30)) == datetime(2016, 1, 1, 9, 12)
+    assert dr.ceil(datetime(2016, 1, 1, 9, 14, 30)) == datetime(2016, 1, 1, 9, 17)
+    assert dr.round(datetime(2016, 1, 1, 9, 14, 30)) == datetime(2016, 1, 1, 9, 17)
+    assert dr.round(datetime(2016, 1, 1, 9, 14)) == datetime(2016, 1, 1, 9, 12)
+    assert dr.floor(datetime(2016, 1, 1, 9, 12)) == datetime(2016, 1, 1, 9, 12)
+    assert dr.ceil(datetime(2016, 1, 1, 9, 12)) == datetime(2016, 1, 1, 9, 12)
+    # the grid continues before the start of the range
+    assert dr.floor(datetime(2015, 12, 31, 23, 59)) == datetime(2015, 12, 31, 23, 57)
+
+
+def test_floor_and_ceil_with_negative_step():
+    dr = DateRange(date(2016, 1, 31), step=timedelta(days=-7))
+
+    assert dr.floor(date(2016, 1, 27)) == date(2016, 1, 24)
+    assert dr.ceil(date(2016, 1, 27)) == date(2016, 1, 31)
+    assert dr.round(date(2016, 1, 28)) == date(2016, 1, 31)
+
+
+def test_floor_ceil_and_round_arrays():
+    np = pytest.importorskip("numpy")
+    dr = DateRange(datetime(2016, 1, 1, 0, 2), step=timedelta(minutes=5))
+    values = np.array(
+        ["2016-01-01T09:14:30", "2016-01-01T09:14", "2016-01-01T09:12", "2015-12-31"],
+        dtype="datetime64[us]",
+    )
+    objects = values.astype(object)
+
+    assert dr.floor(values).astype(object).tolist() == [dr.floor(x) for x in objects]
+    assert dr.ceil(values).astype(object).tolist() == [dr.ceil(x) for x in objects]
+    assert dr.round(values).astype(object).tolist() == [dr.round(x) for x in objects]
+
+
+def test_floor_and_ceil_with_calendar_steps():
+    np = pytest.importorskip("numpy")
+    relativedelta = pytest.importorskip("dateutil.relativedelta").relativedelta
+    dr = DateRange(date(2016, 1, 31), step=relativedelta(months=1))
+
+    assert dr.floor(date(2016, 3, 15)) == date(2016, 2, 29)
+    assert dr.ceil(date(2016, 3, 15)) == date(2016, 3, 31)
+    assert dr.ceil(np.array(["2016-03-15"], dtype="datetime64[D]")).tolist() == [
+        date(2016, 3, 31)
+    ]
+
+
+@pytest.mark.parametrize(
+    "dr,other",
+    [
+        (
+            DateRange(date(2016, 1, 1), date(2016, 1, 10), timedelta(days=3)),
+            DateRange(date(2016, 1, 1), date(2016, 1, 8), timedelta(days=3)),
+        ),
+        (
+            DateRange(date(2016, 1, 1), date(2016, 1, 1), timedelta(days=3)),
+            DateRange(date(2017, 1, 1), date(2015, 1, 1), timedelta(days=1)),
+        ),
+        (
+            DateRange(date(2016, 1, 1), date(2016, 1, 2), timedelta(days=3)),
+            DateRange(date(2016, 1, 1), date(2015, 12, 31), timedelta(days=-1)),
+        ),
+        (
+            DateRange(datetime(2016, 1, 1), step=timedelta(days=1)),
+            DateRange(datetime(2016, 1, 1), step=timedelta(hours=24)),
+        ),
+    ],
+)
+def test_equivalent_ranges_are_equal_and_hash_the_same(dr, other):
+    assert dr == other
+    assert hash(dr) == hash(other)
+    assert len({dr, other}) == 1
+
+
+def test_finite_and_infinite_ranges_are_not_equal():
+    dr = DateRange(date(2016, 1, 1), step=timedelta(days=1))
+
+    assert dr != dr[:10]
+    assert dr != DateRange(date(2016, 1, 1), step=timedelta(days=-1))
+
+
+def test_usable_with_lru_cache():
+    from functools import lru_cache
+
+    calls = []
+
+    @lru_cache(maxsize=None)
+    def size(dr):
+        calls.append(dr)
+        return len(dr)
+
+    dr = DateRange(date(2016, 1, 1), date(2016, 2, 1), timedelta(days=1))
+
+    assert size(dr) == size(dr[:]) == 31
+    assert len(calls) == 1
+
+
+def test_pickle_carries_only_constructor_arguments():
+    import pickle
+
+    dr = DateRange(
+        datetime(2016, 1, 1), datetime(2017, 1, 1), timedelta(minutes=5)
+    )[100:200]
+    arguments = (dr.start, dr.stop, dr.step)
+
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        pickled = pickle.dumps(dr, protocol)
+        overhead = len(pickled) - len(pickle.dumps(arguments, protocol))
+
+        assert pickle.loads(pickled) == dr
+        assert b"_len" not in pickled
+        assert overhead < len(b"datestuff.daterange DateRange") + 20
+
+
+def test_pickle_round_trip_is_fast():
+    import pickle
+    import timeit
+
+    dr = DateRange(datetime(2016, 1, 1), datetime(2017, 1, 1), timedelta(minutes=5))
+
+    # a loose bound, a round trip normally takes around 20 microseconds
+    assert timeit.timeit(lambda: pickle.loads(pickle.dumps(dr)), number=10000) < 3
+
+
+def test_pickle_keeps_calendar_settings():
+    import pickle
+
+    relativedelta = pytest.importorskip("dateutil.relativedelta").relativedelta
+    dr = DateRange(date(2016, 2, 29), step=relativedelta(months=1), month_day=-1)
+
+    assert list(pickle.loads(pickle.dumps(dr))[:3]) == list(dr[:3])
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+# seconds, generous enough for slow machines. Eagerly importing numpy and dateutil
+# alone used to take longer than this.
+IMPORT_BUDGET = 0.1
+
+SCRIPT = """
+import sys, time
+started = time.perf_counter()
+import datestuff
+from datestuff import DateRange, RelativeDate, within_delta
+elapsed = time.perf_counter() - started
+print(elapsed, "dateutil" in sys.modules, "numpy" in sys.modules)
+"""
+
+
+def _import_datestuff():
+    output = subprocess.check_output([sys.executable, "-c", SCRIPT])
+    elapsed, dateutil, numpy = output.decode().split()
+    return float(elapsed), dateutil == "True", numpy == "True"
+
+
+def test_import_does_not_pull_in_optional_dependencies():
+    _, dateutil, numpy = _import_datestuff()
+
+    assert not dateutil
+    assert not numpy
+
+
+def test_import_stays_within_budget():
+    # best of a few runs to smooth over a busy machine
+    elapsed = min(_import_datestuff()[0] for _ in range(3))
+
+    assert elapsed < IMPORT_BUDGET
+
+
+def test_lazy_exports():
+    import datestuff
+    from datestuff.daterange import DateRange
+
+    assert datestuff.DateRange is DateRange
+    assert "DateRange" in dir(datestuff)
+    assert set(datestuff.__all__) <= set(dir(datestuff))
+
+
+def test_unknown_attribute():
+    import datestuff
+    import pytest
+
+    with pytest.raises(AttributeError):
+        datestuff.NotAThing
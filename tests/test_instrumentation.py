@@ -0,0 +1,109 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from datestuff import (
+    BusinessDayRange,
+    DateRange,
+    RelativeDate,
+    ZonedDateRange,
+    frozen_clock,
+)
+from datestuff import instrumentation
+from datestuff.relative import _RelativeBase
+
+
+@pytest.fixture
+def registry():
+    with instrumentation.instrumented() as registry:
+        yield registry
+
+
+def test_disabled_by_default_and_leaves_code_untouched():
+    iterate = DateRange.__dict__["__iter__"]
+
+    with instrumentation.instrumented():
+        assert DateRange.__dict__["__iter__"] is not iterate
+
+    assert instrumentation.active() is None
+    assert DateRange.__dict__["__iter__"] is iterate
+    assert "_now" in _RelativeBase.__dict__
+
+
+def test_counts_and_times_clock_calls(registry):
+    subject = RelativeDate(clock=lambda: date(2016, 1, 1))
+
+    subject == date(2016, 1, 1)
+    subject.year
+
+    with frozen_clock():
+        subject == date(2016, 1, 1)
+        subject == date(2016, 1, 1)
+
+    assert registry.counters["relative.clock"] == 3
+    assert registry.counters["relative.getattr"] == 1
+    assert registry.timers["relative.clock"] > 0
+
+
+def test_counts_materializations(registry):
+    dr = DateRange(date(2016, 1, 1), date(2016, 1, 11), timedelta(days=1))
+
+    list(dr)
+    for when in dr:
+        break
+
+    assert registry.counters["daterange.iterations"] == 2
+    assert registry.counters["daterange.points"] == 11
+
+
+def test_counts_zoned_materializations(registry):
+    start = datetime(2016, 1, 1, tzinfo=timezone(timedelta(hours=1)))
+    dr = ZonedDateRange(start, start + timedelta(days=5), timedelta(days=1))
+
+    list(dr)
+
+    assert registry.counters["daterange.iterations"] == 1
+    assert registry.counters["daterange.points"] == 5
+
+
+def test_counts_business_day_materializations(registry):
+    # 2016-01-01 is a Friday
+    dr = BusinessDayRange(date(2016, 1, 1), date(2016, 1, 15))
+
+    list(dr)
+
+    assert registry.counters["daterange.iterations"] == 1
+    assert registry.counters["daterange.points"] == 10
+
+
+def test_counts_exports_and_slow_paths(registry):
+    np = pytest.importorskip("numpy")
+    relativedelta = pytest.importorskip("dateutil.relativedelta").relativedelta
+    dr = DateRange(date(2016, 1, 31), date(2016, 6, 1), relativedelta(months=1))
+
+    dr.to_numpy()
+    dr.count(np.array(["2016-02-29"], dtype="datetime64[D]"))
+
+    assert registry.counters["daterange.exports"] == 1
+    assert registry.counters["daterange.points"] == 5
+    assert registry.counters["slow_path.DateRange.lookup"] == 1
+
+
+def test_listeners_receive_measurements(registry):
+    received = []
+    registry.subscribe(lambda *measurement: received.append(measurement))
+
+    list(DateRange(date(2016, 1, 1), date(2016, 1, 4), timedelta(days=1)))
+
+    assert received == [
+        ("count", "daterange.iterations", 1),
+        ("count", "daterange.points", 3),
+    ]
+
+
+def test_nested_instrumentation_restores_previous_registry(registry):
+    with instrumentation.instrumented() as inner:
+        list(DateRange(date(2016, 1, 1), date(2016, 1, 4), timedelta(days=1)))
+
+    assert instrumentation.active() is registry
+    assert inner.counters["daterange.points"] == 3
+    assert registry.snapshot() == {"counters": {}, "timers": {}}
@@ -0,0 +1,67 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+import pytest
+from datestuff import DateRange
+from datestuff.parallel import map_range
+
+
+def day_of_year(when):
+    return when.timetuple().tm_yday
+
+
+def hours_since_2016(when):
+    return (when - datetime(2016, 1, 1)).total_seconds() / 3600
+
+
+def test_map_range_in_process_pool():
+    dr = DateRange(date(2016, 1, 1), date(2016, 3, 1), timedelta(days=1))
+
+    with ProcessPoolExecutor(2) as executor:
+        results = map_range(day_of_year, dr, executor=executor, chunksize=7)
+
+    assert results == [day_of_year(d) for d in dr]
+
+
+def test_map_range_creates_its_own_pool():
+    dr = DateRange(date(2016, 1, 1), date(2016, 1, 5), timedelta(days=1))
+
+    assert map_range(day_of_year, dr) == [1, 2, 3, 4]
+
+
+def test_map_range_into_shared_memory():
+    pytest.importorskip("multiprocessing.shared_memory")
+    dr = DateRange(datetime(2016, 1, 1), datetime(2016, 1, 3), timedelta(minutes=90))
+
+    with ProcessPoolExecutor(2) as executor:
+        results = map_range(
+            hours_since_2016, dr, executor=executor, chunksize=5, typecode="d"
+        )
+
+    assert results.typecode == "d"
+    assert results.tolist() == [hours_since_2016(d) for d in dr]
+
+
+def missing_hours(when):
+    return {}[when]
+
+
+def test_map_range_into_shared_memory_raises_func_errors():
+    pytest.importorskip("multiprocessing.shared_memory")
+    dr = DateRange(datetime(2016, 1, 1), datetime(2016, 1, 2), timedelta(hours=1))
+
+    with ThreadPoolExecutor(2) as executor:
+        with pytest.raises(KeyError):
+            map_range(missing_hours, dr, executor=executor, chunksize=5, typecode="d")
+
+
+def test_map_range_with_thread_pool_and_empty_range():
+    dr = DateRange(date(2016, 1, 1), date(2016, 1, 1), timedelta(days=1))
+
+    with ThreadPoolExecutor(2) as executor:
+        assert map_range(day_of_year, dr, executor=executor) == []
+
+
+def test_map_range_refuses_infinite_range():
+    with pytest.raises(TypeError):
+        map_range(day_of_year, DateRange(date(2016, 1, 1), step=timedelta(days=1)))
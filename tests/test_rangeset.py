@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+
+import pytest
+from datestuff import DateRange, RangeSet
+
+ONE_HOUR = timedelta(hours=1)
+
+
+def at(hour, minute=0):
+    return datetime(2016, 1, 1) + timedelta(hours=hour, minutes=minute)
+
+
+@pytest.fixture
+def windows():
+    return [
+        DateRange(at(1), at(3), ONE_HOUR),
+        DateRange(at(2), at(5), ONE_HOUR),
+        DateRange(at(5), at(6), ONE_HOUR),
+        DateRange(at(10), at(12), timedelta(minutes=30)),
+        DateRange(at(20), at(20), ONE_HOUR),
+    ]
+
+
+def test_spans_are_merged(windows):
+    rs = RangeSet(windows)
+
+    assert rs.spans() == [(at(1), at(6)), (at(10), at(12))]
+    assert len(rs) == 4
+
+
+def test_membership(windows):
+    rs = RangeSet(windows)
+
+    assert at(1) in rs
+    assert at(5, 59) in rs
+    assert at(6) not in rs
+    assert at(0) not in rs
+    assert at(11, 45) in rs
+    assert at(20) not in rs
+
+
+def test_covering(windows):
+    rs = RangeSet(windows)
+
+    assert set(rs.covering(at(2, 30))) == {windows[0], windows[1]}
+    assert rs.covering(at(5)) == [windows[2]]
+    assert rs.covering(at(7)) == []
+
+
+def test_next_covered(windows):
+    rs = RangeSet(windows)
+
+    assert rs.next_covered(at(0)) == at(1)
+    assert rs.next_covered(at(2)) == at(2)
+    assert rs.next_covered(at(6)) == at(10)
+    assert rs.next_covered(at(12)) is None
+
+
+def test_reversed_ranges_cover_the_same_buckets():
+    rs = RangeSet([DateRange(at(5), at(1), -ONE_HOUR)])
+    ascending = DateRange(at(2), at(6), ONE_HOUR)
+
+    assert rs.spans() == [(at(2), at(6))]
+    for when in (at(1, 30), at(2), at(5, 30), at(6)):
+        assert (when in rs) == (ascending.bucket_of(when) is not None)
+
+
+def test_open_ended_ranges():
+    rs = RangeSet(
+        [
+            DateRange(at(10), step=ONE_HOUR),
+            DateRange(at(2), step=-ONE_HOUR),
+            DateRange(at(4), at(6), ONE_HOUR),
+        ]
+    )
+
+    assert rs.spans() == [(None, at(3)), (at(4), at(6)), (at(10), None)]
+    assert datetime(1900, 1, 1) in rs
+    assert datetime(2900, 1, 1) in rs
+    assert at(3) not in rs
+    assert rs.next_covered(at(6)) == at(10)
+    assert len(rs.covering(datetime(2900, 1, 1))) == 1
+
+
+def test_many_ranges_match_checking_each_one():
+    ranges = [
+        DateRange(at(hour), at(hour + length), timedelta(minutes=15))
+        for hour in range(0, 200, 3)
+        for length in (1, 4, 7)
+    ]
+    rs = RangeSet(ranges)
+
+    for minute in range(0, 210 * 60, 20):
+        when = at(0, minute)
+        expected = [dr for dr in ranges if dr.start <= when < dr.stop]
+
+        assert set(rs.covering(when)) == set(expected)
+        assert (when in rs) == bool(expected)
+
+
+def test_empty():
+    rs = RangeSet()
+
+    assert at(1) not in rs
+    assert rs.covering(at(1)) == []
+    assert rs.next_covered(at(1)) is None
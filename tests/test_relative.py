@@ -2,7 +2,7 @@ import operator
 from datetime import date, datetime, timedelta, tzinfo
 
 import pytest
-from datestuff.relative import RelativeDate, RelativeDateTime
+from datestuff.relative import RelativeDate, RelativeDateTime, frozen_clock
 from datestuff.utils import within_delta
 from dateutil.relativedelta import relativedelta
 
@@ -253,3 +253,83 @@ class TestRelativeDeltaInterop(object):
         assert rd - rd == RelativeDate.fromdate(
             date(2016, 1, 1), offset=relativedelta()
         )
+
+
+class TestFrozenClock(object):
+    def test_clock_is_called_once_per_scope(self, counting_clock):
+        clock = counting_clock(TODAY)
+        lower = RelativeDate(offset=timedelta(days=-30), clock=clock)
+        upper = RelativeDate(clock=clock)
+
+        with frozen_clock():
+            for _ in range(5):
+                assert lower <= YESTERDAY < upper
+            assert "{:%Y}".format(upper) == "2016"
+            assert upper.year == 2016
+            assert str(lower) == "2015-12-02"
+
+        assert clock.calls == 1
+
+    def test_clock_is_called_again_outside_of_scope(self, counting_clock):
+        clock = counting_clock(TODAY)
+        subject = RelativeDate(clock=clock)
+
+        with frozen_clock():
+            subject == TODAY
+        subject == TODAY
+        subject == TODAY
+
+        assert clock.calls == 3
+
+    def test_each_scope_takes_a_new_snapshot(self, counting_clock):
+        clock = counting_clock(TODAY)
+        subject = RelativeDate(clock=clock)
+
+        with frozen_clock():
+            assert subject == TODAY
+
+        clock.when = TOMORROW
+
+        with frozen_clock():
+            assert subject == TOMORROW
+            with frozen_clock():
+                assert subject == TOMORROW
+
+        assert clock.calls == 2
+
+    def test_snapshot_is_not_shared_with_other_threads(self, counting_clock):
+        import threading
+
+        clock = counting_clock(NOW)
+        subject = RelativeDateTime(clock=clock)
+
+        with frozen_clock():
+            subject == NOW
+            worker = threading.Thread(target=lambda: subject == NOW)
+            worker.start()
+            worker.join()
+            subject == NOW
+
+        assert clock.calls == 2
+
+    def test_unhashable_clock_is_called_every_time(self, counting_clock):
+        class UnhashableClock(counting_clock):
+            __hash__ = None
+
+        clock = UnhashableClock(TODAY)
+        subject = RelativeDate(clock=clock)
+
+        with frozen_clock():
+            subject == TODAY
+            subject == TODAY
+
+        assert clock.calls == 2
+
+
+@pytest.mark.parametrize("cls", [RelativeDate, RelativeDateTime])
+def test_relative_types_are_slotted(cls):
+    subject = cls(clock=lambda: NOW)
+
+    assert type(subject).__dictoffset__ == 0
+    subject.offset = timedelta(days=1)
+    assert subject == NOW + timedelta(days=1)
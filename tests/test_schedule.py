@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+from itertools import islice
+
+import pytest
+from datestuff import DateRange, Schedule
+
+
+def at(hour, minute=0):
+    return datetime(2016, 1, 1) + timedelta(hours=hour, minutes=minute)
+
+
+@pytest.fixture
+def schedule():
+    return Schedule(
+        [
+            DateRange(at(0), step=timedelta(minutes=15)),
+            DateRange(at(0, 10), at(2), timedelta(minutes=20)),
+            DateRange(at(1), at(1, 1), timedelta(hours=1)),
+        ]
+    )
+
+
+def test_iteration_merges_and_deduplicates(schedule):
+    assert list(islice(schedule, 8)) == [
+        at(0),
+        at(0, 10),
+        at(0, 15),
+        at(0, 30),
+        at(0, 45),
+        at(0, 50),
+        at(1),
+        at(1, 10),
+    ]
+
+
+def test_iter_from(schedule):
+    assert list(islice(schedule.iter_from(at(1, 45)), 3)) == [
+        at(1, 45),
+        at(1, 50),
+        at(2),
+    ]
+
+
+def test_next_after(schedule):
+    assert schedule.next_after(at(0)) == at(0, 10)
+    assert schedule.next_after(at(0, 47)) == at(0, 50)
+    assert schedule.next_after(at(10000)) == at(10000, 15)
+
+
+def test_prev_before(schedule):
+    assert schedule.prev_before(at(0)) is None
+    assert schedule.prev_before(at(1)) == at(0, 50)
+    assert schedule.prev_before(at(1, 12)) == at(1, 10)
+
+
+def test_finite_ranges_run_out():
+    schedule = Schedule([DateRange(at(0), at(1), timedelta(minutes=30))])
+
+    assert list(schedule) == [at(0), at(0, 30)]
+    assert schedule.next_after(at(0, 30)) is None
+    assert schedule.prev_before(at(5)) == at(0, 30)
+
+
+def test_membership(schedule):
+    assert at(0, 50) in schedule
+    assert at(0, 55) not in schedule
+
+
+def test_requires_ascending_ranges():
+    with pytest.raises(ValueError):
+        Schedule([DateRange(at(1), at(0), -timedelta(minutes=5))])
+
+
+def test_empty():
+    schedule = Schedule()
+
+    assert list(schedule) == []
+    assert schedule.next_after(at(0)) is None
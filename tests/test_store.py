@@ -0,0 +1,106 @@
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+
+import pytest
+from datestuff import BusinessDayRange, DateRange
+from datestuff.store import Store, write_store
+
+HOLIDAYS = [date(2016, 12, 26), date(2016, 12, 25), date(2017, 1, 1)]
+
+
+@pytest.fixture
+def ranges():
+    return {
+        7: DateRange(date(2016, 1, 1), date(2017, 1, 2), timedelta(days=1)),
+        3: DateRange(datetime(2016, 1, 1, 9, 30), step=timedelta(minutes=15)),
+        2 ** 40: DateRange(
+            datetime(2016, 1, 1, 0, 0, 0, 1),
+            datetime(2015, 1, 1),
+            timedelta(hours=-7),
+        ),
+    }
+
+
+@pytest.fixture
+def path(tmpdir, ranges):
+    path = str(tmpdir.join("schedules.bin"))
+    write_store(path, ranges, {7: HOLIDAYS})
+    return path
+
+
+def test_roundtrip(path, ranges):
+    with Store(path) as store:
+        assert len(store) == 3
+        assert list(store) == [3, 7, 2 ** 40]
+
+        for key, dr in ranges.items():
+            assert key in store
+            loaded = store[key]
+
+            assert loaded == dr
+            assert loaded.__reduce__() == dr.__reduce__()
+
+
+def test_missing_ids(path):
+    with Store(path) as store:
+        assert 4 not in store
+        assert store.get(4) is None
+
+        with pytest.raises(KeyError):
+            store[4]
+
+
+def test_exceptions(path):
+    with Store(path) as store:
+        assert store.exceptions(7) == sorted(HOLIDAYS)
+        assert store.exceptions(3) == []
+        assert store.is_exception(7, date(2016, 12, 25))
+        assert not store.is_exception(7, date(2016, 12, 24))
+        assert store.contains(7, date(2016, 12, 24))
+        assert not store.contains(7, date(2016, 12, 25))
+        assert not store.contains(7, date(2017, 1, 2))
+
+
+def test_rejects_other_files(tmpdir):
+    path = tmpdir.join("other.bin")
+    path.write_binary(b"not a store at all, just some bytes")
+
+    with pytest.raises(ValueError):
+        Store(str(path))
+
+
+@pytest.mark.parametrize("size", [0, 10, 40, -1])
+def test_rejects_truncated_files(tmpdir, path, size):
+    truncated = tmpdir.join("truncated.bin")
+    with open(path, "rb") as fh:
+        truncated.write_binary(fh.read()[:size])
+
+    with pytest.raises(ValueError):
+        Store(str(truncated))
+
+
+def test_rejects_calendar_steps(tmpdir):
+    relativedelta = pytest.importorskip("dateutil.relativedelta").relativedelta
+    dr = DateRange(date(2016, 1, 1), step=relativedelta(months=1))
+
+    with pytest.raises(TypeError):
+        write_store(str(tmpdir.join("calendar.bin")), {1: dr})
+
+
+def test_rejects_business_day_steps(tmpdir):
+    dr = BusinessDayRange(date(2016, 1, 1), date(2016, 2, 1))
+
+    with pytest.raises(TypeError):
+        write_store(str(tmpdir.join("busday.bin")), {1: dr})
+
+
+def _load(path, key):
+    with Store(path) as store:
+        return store[key][10].isoformat()
+
+
+def test_shared_between_processes(path, ranges):
+    with ProcessPoolExecutor(2) as executor:
+        results = list(executor.map(_load, [path] * 3, sorted(ranges)))
+
+    assert results == [ranges[key][10].isoformat() for key in sorted(ranges)]
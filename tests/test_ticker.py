@@ -0,0 +1,190 @@
+import asyncio
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from datestuff import DateRange
+from datestuff.ticker import TickScheduler
+
+
+class FakeClock(object):
+    def __init__(self, now):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += timedelta(seconds=seconds)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def collect(ticker, limit=None):
+    ticks = []
+    async for tick in ticker:
+        ticks.append(tick)
+        if limit is not None and len(ticks) == limit:
+            break
+    return ticks
+
+
+def test_aticks_sleeps_until_each_point():
+    clock = FakeClock(datetime(2016, 1, 1, 8, 59, 30))
+    dr = DateRange(
+        datetime(2016, 1, 1, 9), datetime(2016, 1, 1, 9, 3), timedelta(minutes=1)
+    )
+
+    ticks = run(collect(dr.aticks(clock=clock, sleep=clock.sleep)))
+
+    assert ticks == list(dr)
+    assert clock.sleeps == [30, 60, 60]
+
+
+def test_aticks_skips_missed_points():
+    clock = FakeClock(datetime(2016, 1, 1, 9, 59, 59))
+    dr = DateRange(datetime(2016, 1, 1), step=timedelta(seconds=1))
+
+    ticks = run(collect(dr.aticks(clock=clock, sleep=clock.sleep), limit=2))
+
+    assert ticks == [datetime(2016, 1, 1, 9, 59, 59), datetime(2016, 1, 1, 10)]
+    assert clock.sleeps == [1]
+
+
+def test_aticks_yields_last_point_once_when_range_is_over():
+    clock = FakeClock(datetime(2017, 1, 1))
+    dr = DateRange(datetime(2016, 1, 1), datetime(2016, 1, 5), timedelta(days=1))
+
+    assert run(collect(dr.aticks(clock=clock, sleep=clock.sleep))) == [
+        datetime(2016, 1, 4)
+    ]
+
+
+def test_aticks_refuses_negative_steps():
+    dr = DateRange(datetime(2016, 1, 1), step=timedelta(days=-1))
+
+    with pytest.raises(ValueError):
+        dr.aticks()
+
+
+def test_scheduler_multiplexes_schedules():
+    clock = FakeClock(datetime(2016, 1, 1, 9))
+    scheduler = TickScheduler(clock=clock, sleep=clock.sleep)
+    fired = []
+
+    minutes = DateRange(
+        datetime(2016, 1, 1, 9), datetime(2016, 1, 1, 9, 4), timedelta(minutes=1)
+    )
+    odd = DateRange(
+        datetime(2016, 1, 1, 9, 1, 30), datetime(2016, 1, 1, 9, 5), timedelta(minutes=2)
+    )
+
+    scheduler.add(minutes, lambda when: fired.append(("minutes", when)))
+    scheduler.add(odd, lambda when: fired.append(("odd", when)))
+    run(scheduler.run())
+
+    assert fired == sorted(
+        [("minutes", when) for when in minutes] + [("odd", when) for when in odd],
+        key=lambda pair: pair[1],
+    )
+    assert len(scheduler) == 0
+
+
+def test_scheduler_skips_missed_points_and_runs_coroutines():
+    clock = FakeClock(datetime(2016, 1, 1, 12))
+    scheduler = TickScheduler(clock=clock, sleep=clock.sleep)
+    fired = []
+
+    async def callback(when):
+        fired.append(when)
+
+    scheduler.add(
+        DateRange(datetime(2016, 1, 1), datetime(2016, 1, 1, 14), timedelta(hours=1)),
+        callback,
+    )
+    run(scheduler.run())
+
+    assert fired == [datetime(2016, 1, 1, x) for x in (12, 13)]
+
+
+def test_scheduler_cancel():
+    clock = FakeClock(datetime(2016, 1, 1))
+    scheduler = TickScheduler(clock=clock, sleep=clock.sleep)
+    fired = []
+
+    handle = scheduler.add(
+        DateRange(datetime(2016, 1, 1), step=timedelta(hours=1)), fired.append
+    )
+
+    def cancel(when):
+        handle.cancel()
+
+    scheduler.add(
+        DateRange(datetime(2016, 1, 1, 2, 30), datetime(2016, 1, 1, 3), timedelta(1)),
+        cancel,
+    )
+    run(scheduler.run())
+
+    assert fired == [datetime(2016, 1, 1, x) for x in range(3)]
+
+
+def test_scheduler_wakes_up_for_new_schedules():
+    started, base = time.monotonic(), datetime(2016, 1, 1)
+    clock = lambda: base + timedelta(seconds=time.monotonic() - started)  # noqa
+    scheduler = TickScheduler(clock=clock)
+    fired = []
+
+    async def main():
+        runner = asyncio.ensure_future(scheduler.run())
+        far = scheduler.add(DateRange(base + timedelta(days=1), step=timedelta(1)), id)
+        await asyncio.sleep(0)
+        scheduler.add(
+            DateRange(base, base + timedelta(seconds=1), timedelta(1)),
+            lambda when: far.cancel() or fired.append(when),
+        )
+        await asyncio.wait_for(runner, 1)
+
+    run(main())
+
+    assert fired == [base]
+
+
+def test_scheduler_wakes_up_a_custom_sleep_for_new_schedules():
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+        await asyncio.sleep(seconds)
+
+    base = datetime(2016, 1, 1)
+    scheduler = TickScheduler(clock=lambda: base, sleep=sleep)
+    fired = []
+
+    async def main():
+        runner = asyncio.ensure_future(scheduler.run())
+        far = scheduler.add(DateRange(base + timedelta(days=1), step=timedelta(1)), id)
+        await asyncio.sleep(0)
+        scheduler.add(
+            DateRange(base, base + timedelta(seconds=1), timedelta(1)),
+            lambda when: far.cancel() or fired.append(when),
+        )
+        await asyncio.wait_for(runner, 1)
+
+    run(main())
+
+    assert fired == [base]
+    assert sleeps == [86400]
+
+
+@pytest.mark.parametrize(
+    "start", [date(2016, 1, 1), datetime(2016, 1, 1, tzinfo=timezone.utc)]
+)
+def test_scheduler_requires_a_clock_for_other_ranges(start):
+    scheduler = TickScheduler()
+
+    with pytest.raises(TypeError):
+        scheduler.add(DateRange(start, step=timedelta(days=1)), id)
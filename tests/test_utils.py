@@ -1,5 +1,13 @@
 from datetime import timedelta, datetime
-from datestuff.utils import within_delta
+
+import pytest
+from datestuff.utils import (
+    asof_join,
+    asof_join_indices,
+    tolerance_join,
+    tolerance_join_indices,
+    within_delta,
+)
 
 
 def test_within_delta():
@@ -8,3 +16,83 @@ def test_within_delta():
 
     assert within_delta(d1, d2, timedelta(seconds=1))
     assert not within_delta(d1, d2, timedelta(microseconds=1))
+
+
+def _brute_force_join(left, right, delta):
+    return [(a, b) for a in left for b in right if within_delta(a, b, delta)]
+
+
+def test_tolerance_join_matches_nested_loop():
+    base = datetime(2016, 1, 1)
+    left = [base + timedelta(seconds=s) for s in (0, 3, 4, 10, 30, 31)]
+    right = [base + timedelta(seconds=s) for s in (-2, 1, 4, 5, 12, 29, 40)]
+    delta = timedelta(seconds=2)
+
+    assert list(tolerance_join(left, right, delta)) == _brute_force_join(
+        left, right, delta
+    )
+
+
+def test_tolerance_join_streams_with_key():
+    base = datetime(2016, 1, 1)
+    left = ((base + timedelta(minutes=m), "l{}".format(m)) for m in range(0, 60, 5))
+    right = ((base + timedelta(minutes=m), "r{}".format(m)) for m in range(0, 60, 7))
+
+    pairs = tolerance_join(left, right, timedelta(minutes=1), key=lambda e: e[0])
+
+    assert [(a[1], b[1]) for a, b in pairs] == [
+        ("l0", "r0"),
+        ("l15", "r14"),
+        ("l20", "r21"),
+        ("l35", "r35"),
+        ("l50", "r49"),
+        ("l55", "r56"),
+    ]
+
+
+def test_asof_join():
+    base = datetime(2016, 1, 1)
+    left = [base + timedelta(seconds=s) for s in (-1, 0, 5, 9, 30)]
+    right = [base + timedelta(seconds=s) for s in (0, 4, 8)]
+
+    assert list(asof_join(left, right)) == [
+        (left[0], None),
+        (left[1], right[0]),
+        (left[2], right[1]),
+        (left[3], right[2]),
+        (left[4], right[2]),
+    ]
+    assert [r for _, r in asof_join(left, right, tolerance=timedelta(seconds=5))] == [
+        None,
+        right[0],
+        right[1],
+        right[2],
+        None,
+    ]
+
+
+def test_tolerance_join_indices():
+    np = pytest.importorskip("numpy")
+    base = datetime(2016, 1, 1)
+    left = [base + timedelta(seconds=s) for s in (0, 3, 4, 10, 30, 31)]
+    right = [base + timedelta(seconds=s) for s in (-2, 1, 4, 5, 12, 29, 40)]
+    delta = timedelta(seconds=2)
+
+    li, ri = tolerance_join_indices(
+        np.array(left, dtype="datetime64[us]"),
+        np.array(right, dtype="datetime64[us]"),
+        delta,
+    )
+
+    assert [(left[i], right[j]) for i, j in zip(li, ri)] == _brute_force_join(
+        left, right, delta
+    )
+
+
+def test_asof_join_indices():
+    np = pytest.importorskip("numpy")
+    left = np.array(["2016-01-01", "2016-01-05", "2016-01-20"], dtype="datetime64[D]")
+    right = np.array(["2016-01-02", "2016-01-04"], dtype="datetime64[D]")
+
+    assert asof_join_indices(left, right).tolist() == [-1, 1, 1]
+    assert asof_join_indices(left, right, timedelta(days=3)).tolist() == [-1, 1, -1]
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+from itertools import count, islice
+
+import pytest
+from datestuff import DateRange
+from datestuff.windowing import (
+    Window,
+    assign_windows,
+    sliding_windows,
+    tumbling_windows,
+)
+
+FIVE_MINUTES = timedelta(minutes=5)
+
+
+def at(minute, second=0):
+    return datetime(2016, 1, 1) + timedelta(minutes=minute, seconds=second)
+
+
+@pytest.fixture
+def grid():
+    return DateRange(at(0), step=FIVE_MINUTES)
+
+
+def test_tumbling_windows(grid):
+    events = [(at(1), "a"), (at(3), "b"), (at(6), "c"), (at(17), "d")]
+
+    assert list(tumbling_windows(events, grid)) == [
+        Window(at(0), at(5), [(at(1), "a"), (at(3), "b")]),
+        Window(at(5), at(10), [(at(6), "c")]),
+        Window(at(15), at(20), [(at(17), "d")]),
+    ]
+
+
+def test_sliding_windows(grid):
+    events = [(at(1), "a"), (at(6), "b"), (at(11), "c")]
+    windows = list(sliding_windows(events, grid, 2))
+
+    assert [(w.start, [p for _, p in w.events]) for w in windows] == [
+        (at(0), ["a", "b"]),
+        (at(5), ["b", "c"]),
+        (at(10), ["c"]),
+    ]
+    assert windows[0].end == at(10)
+
+
+def test_windows_close_as_the_watermark_passes(grid):
+    emitted = []
+
+    def events():
+        for minute in (1, 4, 6, 12):
+            yield at(minute), minute
+            emitted.append(minute)
+
+    windows = tumbling_windows(events(), grid)
+
+    assert next(windows).start == at(0)
+    # the first window closes once the event at minute 6 has been seen
+    assert emitted == [1, 4]
+
+
+def test_late_events_within_lateness_are_kept(grid):
+    events = [(at(1), "a"), (at(6), "b"), (at(4), "late but allowed"), (at(9), "c")]
+    late = []
+    windows = list(
+        tumbling_windows(
+            events, grid, timedelta(minutes=2), lambda t, p: late.append(p)
+        )
+    )
+
+    assert [p for _, p in windows[0].events] == ["a", "late but allowed"]
+    assert late == []
+
+
+def test_late_events_are_reported(grid):
+    events = [(at(1), "a"), (at(11), "b"), (at(4), "too late"), (at(-1), "outside")]
+    late = []
+    windows = list(tumbling_windows(events, grid, on_late=lambda t, p: late.append(p)))
+
+    assert late == ["too late"]
+    assert [w.start for w in windows] == [at(0), at(10)]
+
+
+def test_partially_late_events_join_open_windows(grid):
+    events = [(at(1), "a"), (at(10), "b"), (at(6), "c")]
+    windows = list(assign_windows(events, grid, size=2))
+
+    assert [(w.start, [p for _, p in w.events]) for w in windows] == [
+        (at(0), ["a"]),
+        (at(5), ["b", "c"]),
+        (at(10), ["b"]),
+    ]
+
+
+def test_finite_range_ignores_events_past_the_end():
+    dr = DateRange(at(0), at(10), FIVE_MINUTES)
+    events = [(at(1), "a"), (at(12), "b"), (at(25), "c")]
+
+    assert [w.start for w in sliding_windows(events, dr, 3)] == [at(0), at(5)]
+
+
+def test_unbounded_stream_keeps_only_open_windows(grid):
+    events = ((at(0, second), second) for second in count(0, 30))
+    windows = tumbling_windows(events, grid)
+
+    assert [len(w.events) for w in islice(windows, 3)] == [10, 10, 10]
+
+
+@pytest.mark.parametrize("size", [0, -1])
+def test_invalid_size(grid, size):
+    with pytest.raises(ValueError):
+        next(assign_windows([], grid, size))
+
+
+def test_requires_positive_step():
+    dr = DateRange(at(10), at(0), -FIVE_MINUTES)
+
+    with pytest.raises(ValueError):
+        next(tumbling_windows([], dr))
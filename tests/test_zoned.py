@@ -0,0 +1,197 @@
+import pickle
+from datetime import datetime, timedelta
+
+import pytest
+from datestuff import DateRange, ZonedDateRange
+
+zoneinfo = pytest.importorskip("zoneinfo")
+
+try:
+    BERLIN = zoneinfo.ZoneInfo("Europe/Berlin")
+except zoneinfo.ZoneInfoNotFoundError:  # pragma: no cover
+    pytest.skip("no timezone database available", allow_module_level=True)
+
+UTC = zoneinfo.ZoneInfo("UTC")
+ONE_DAY = timedelta(days=1)
+
+
+def berlin(*args, **kwargs):
+    return datetime(*args, tzinfo=BERLIN, **kwargs)
+
+
+def as_utc(when):
+    return when.astimezone(UTC).replace(tzinfo=None)
+
+
+@pytest.fixture
+def mornings():
+    # spring forward happens early on 2024-03-31
+    return ZonedDateRange(berlin(2024, 3, 29, 9), berlin(2024, 4, 3, 9), ONE_DAY)
+
+
+def test_wall_mode_keeps_the_wall_clock(mornings):
+    assert [d.hour for d in mornings] == [9] * 5
+    assert mornings[3] - mornings[2] == ONE_DAY
+    assert as_utc(mornings[2]) - as_utc(mornings[1]) == timedelta(hours=23)
+
+
+def test_absolute_mode_keeps_elapsed_time(mornings):
+    dr = ZonedDateRange(mornings.start, mornings.stop, ONE_DAY, mode="absolute")
+
+    assert [d.hour for d in dr] == [9, 9, 10, 10, 10]
+    assert len(dr) == 5
+    assert as_utc(dr[2]) - as_utc(dr[1]) == ONE_DAY
+
+
+def test_wall_mode_moves_skipped_times_forward():
+    dr = ZonedDateRange(berlin(2024, 3, 30, 2, 30), step=ONE_DAY)
+
+    assert dr[1] == berlin(2024, 3, 31, 3, 30)
+    assert dr[2] == berlin(2024, 4, 1, 2, 30)
+    assert dr.index(dr[1]) == 1
+    assert dr.searchsorted(dr[1]) == 1
+    assert dr.searchsorted(dr[1], side="right") == 2
+
+
+@pytest.mark.parametrize("minutes", [30, 60, -30, -60])
+def test_wall_mode_drops_skipped_times_that_would_collide(minutes):
+    step = timedelta(minutes=minutes)
+    start = berlin(2024, 3, 31, 1) if minutes > 0 else berlin(2024, 3, 31, 4)
+    dr = ZonedDateRange(start, start + step * 6, step)
+    instants = [as_utc(d) for d in dr]
+
+    if minutes < 0:
+        instants.reverse()
+    assert all(a < b for a, b in zip(instants, instants[1:]))
+    assert [dr.index(d) for d in dr] == list(range(len(dr)))
+    assert len(dr) == len(list(dr)) == 6 - 60 // abs(minutes)
+
+
+def test_wall_mode_drops_skipped_times_in_lookups():
+    np = pytest.importorskip("numpy")
+    dr = ZonedDateRange(
+        berlin(2024, 3, 31, 1), berlin(2024, 3, 31, 5), timedelta(hours=1)
+    )
+    instants = np.array([as_utc(d) for d in dr], dtype="datetime64[us]")
+
+    assert [d.hour for d in dr] == [1, 3, 4]
+    assert (dr.to_numpy() == instants).all()
+    assert (dr.index(instants) == np.arange(3)).all()
+    assert dr.searchsorted(berlin(2024, 3, 31, 3)) == 1
+    assert dr.floor(berlin(2024, 3, 31, 3, 30)) == berlin(2024, 3, 31, 3)
+
+
+def test_wall_mode_uses_first_occurrence_of_repeated_times():
+    # fall back happens at 03:00 on 2024-10-27, 02:00 to 03:00 happens twice
+    dr = ZonedDateRange(berlin(2024, 10, 27, 1, 30), step=timedelta(minutes=30))
+    points = list(dr[:5])
+
+    summer, winter = timedelta(hours=2), timedelta(hours=1)
+
+    assert [d.strftime("%H:%M") for d in points] == [
+        "01:30",
+        "02:00",
+        "02:30",
+        "03:00",
+        "03:30",
+    ]
+    assert [d.utcoffset() for d in points] == [summer] * 3 + [winter] * 2
+    assert berlin(2024, 10, 27, 2, 30, fold=1) not in dr
+    assert berlin(2024, 10, 27, 2, 30) in dr
+
+
+def test_membership_compares_instants(mornings):
+    assert berlin(2024, 4, 1, 9) in mornings
+    assert datetime(2024, 4, 1, 7, tzinfo=UTC) in mornings
+    assert berlin(2024, 4, 1, 10) not in mornings
+    assert berlin(2024, 4, 3, 9) not in mornings
+    assert mornings.index(berlin(2024, 3, 31, 9)) == 2
+
+
+def test_naive_values_are_rejected(mornings):
+    with pytest.raises(TypeError):
+        datetime(2024, 4, 1, 9) in mornings
+
+
+def test_requires_aware_start_and_fixed_step():
+    with pytest.raises(TypeError):
+        ZonedDateRange(datetime(2024, 1, 1), step=ONE_DAY)
+
+    with pytest.raises(TypeError):
+        ZonedDateRange(berlin(2024, 1, 1), step=1)
+
+    with pytest.raises(ValueError):
+        ZonedDateRange(berlin(2024, 1, 1), step=ONE_DAY, mode="local")
+
+
+def test_len_across_transitions():
+    dr = ZonedDateRange(berlin(2020, 1, 1), berlin(2030, 1, 1), timedelta(hours=1))
+
+    naive = DateRange(as_utc(dr.start), as_utc(dr.stop), timedelta(hours=1))
+
+    # the hour skipped by each spring forward is dropped, the repeated one isn't
+    # visited twice
+    assert len(dr) == len(naive) - 10
+    assert as_utc(dr[-1]) == datetime(2029, 12, 31, 22)
+
+
+def test_slicing_keeps_mode(mornings):
+    sliced = mornings[1:4]
+
+    assert isinstance(sliced, ZonedDateRange)
+    assert sliced.mode == "wall"
+    assert list(sliced) == list(mornings)[1:4]
+
+
+def test_reversed(mornings):
+    backwards = reversed(mornings)
+
+    assert isinstance(backwards, ZonedDateRange)
+    assert list(backwards) == [berlin(2024, 4, day, 9) for day in (3, 2, 1)] + [
+        berlin(2024, 3, day, 9) for day in (31, 30)
+    ]
+
+
+def test_equality_considers_mode(mornings):
+    absolute = ZonedDateRange(mornings.start, mornings.stop, ONE_DAY, mode="absolute")
+
+    assert mornings == mornings[:]
+    assert hash(mornings) == hash(mornings[:])
+    assert mornings != absolute
+
+
+def test_pickle_roundtrip(mornings):
+    assert pickle.loads(pickle.dumps(mornings)) == mornings
+
+
+def test_set_operations_are_unsupported(mornings):
+    with pytest.raises(TypeError):
+        mornings.intersection(mornings)
+
+
+def test_to_numpy_returns_utc_instants(mornings):
+    np = pytest.importorskip("numpy")
+
+    expected = np.array([as_utc(d) for d in mornings], dtype="datetime64[us]")
+
+    assert (mornings.to_numpy() == expected).all()
+    assert (mornings.index(expected) == np.arange(5)).all()
+    assert mornings.count(expected + np.timedelta64(1, "h")).sum() == 0
+
+
+def test_floor_and_ceil_across_transitions(mornings):
+    np = pytest.importorskip("numpy")
+    values = [berlin(2024, 3, 31, 8, 30), berlin(2024, 3, 31, 9), berlin(2024, 4, 1)]
+    instants = np.array([as_utc(value) for value in values], dtype="datetime64[us]")
+
+    assert [mornings.floor(value) for value in values] == [
+        berlin(2024, 3, 30, 9),
+        berlin(2024, 3, 31, 9),
+        berlin(2024, 3, 31, 9),
+    ]
+    assert mornings.ceil(values[0]) == berlin(2024, 3, 31, 9)
+    assert mornings.ceil(instants).tolist() == [
+        as_utc(berlin(2024, 3, 31, 9)),
+        as_utc(berlin(2024, 3, 31, 9)),
+        as_utc(berlin(2024, 4, 1, 9)),
+    ]